@@ -0,0 +1,56 @@
+"""Throughput and memory of the activity timeline generator.
+
+Usage: python benchmarks/bench_activities.py [--years 5]
+
+Streams the full five-bird timeline for Chennai and reports years of
+timeline generated per second, then compares peak traced memory for a short
+and a long range to show it does not grow with the range.
+"""
+import argparse
+import datetime
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vedic_bird.activities import activity_periods
+
+LOCATION = (13.08, 80.27, "Asia/Kolkata")
+
+
+def drain(years):
+    start = datetime.date(2000, 1, 1)
+    end = start.replace(year=start.year + years) - datetime.timedelta(days=1)
+    count = 0
+    for _ in activity_periods(start, end, *LOCATION):
+        count += 1
+    return count
+
+
+def peak_memory(years):
+    tracemalloc.start()
+    drain(years)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=5)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    count = drain(args.years)
+    elapsed = time.perf_counter() - t0
+    print(f"{count} periods over {args.years} years in {elapsed:.2f} s: "
+          f"{args.years / elapsed:.1f} years/s, {count / elapsed:,.0f} periods/s")
+
+    short, long_ = peak_memory(1), peak_memory(args.years)
+    print(f"peak traced memory: {short / 1024:.0f} KiB for 1 year, {long_ / 1024:.0f} KiB for {args.years} years")
+
+
+if __name__ == "__main__":
+    main()
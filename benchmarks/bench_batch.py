@@ -0,0 +1,89 @@
+"""Compare the scalar chart pipeline with vedic_bird.batch.
+
+Usage: python benchmarks/bench_batch.py [--rows N] [--scalar-rows N] [--repeat N]
+
+The scalar path is timed on a sample and extrapolated to --rows, since
+running it over 10M rows takes minutes. Both paths are checked against each
+other on the sample before any timing is reported. The speedup depends on
+the machine and its load, so both sides report the best of --repeat runs.
+"""
+import argparse
+import math
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vedic_bird import batch, tables
+from vedic_bird.astro import julian_date, calculate_sun_longitude, calculate_moon_longitude, calculate_ayanamsa
+
+CODE_FIELDS = ("bird", "siddha_force", "element", "string_type")
+
+
+# Same steps as the "Generate Insights" handler in app.py
+def scalar_chart(jd):
+    d = jd - 2451545.0
+    sun_long = calculate_sun_longitude(d)
+    moon_long = calculate_moon_longitude(d)
+    sid_moon = (moon_long - calculate_ayanamsa(jd)) % 360
+    nak_num = math.floor(sid_moon / (360 / 27))
+    pada = math.floor((sid_moon % (360 / 27)) / (360 / 108)) + 1
+    rashi_num = math.floor(sid_moon / 30)
+    paksha = 0 if (moon_long - sun_long) % 360 < 180 else 1
+    return sun_long, moon_long, nak_num, pada, rashi_num, paksha
+
+
+def random_minutes(n, seed=0):
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("1900-01-01T00:00", "m").astype(np.int64)
+    stop = np.datetime64("2101-01-01T00:00", "m").astype(np.int64)
+    return rng.integers(start, stop, n).astype("datetime64[m]")
+
+
+def check(times, interpolate):
+    res = batch.compute(times, interpolate=interpolate)
+    mismatches = 0
+    for i, t in enumerate(times.tolist()):
+        jd = julian_date(t.year, t.month, t.day, t.hour, t.minute)
+        sun, moon, nak, pada, rashi, paksha = scalar_chart(jd)
+        if (abs(sun - res["sun_long"][i]) > 1e-9 or abs(moon - res["moon_long"][i]) > 1e-9
+                or (nak, pada, rashi, paksha) != (res["nak_num"][i], res["pada"][i], res["rashi_num"][i], res["paksha"][i])
+                or tables.chart_codes(nak, paksha) != tuple(res[field][i] for field in CODE_FIELDS)):
+            mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--scalar-rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per path; the best is reported")
+    args = parser.parse_args()
+
+    sample = random_minutes(args.scalar_rows, seed=1)
+    for interpolate in (False, True):
+        mismatches = check(sample, interpolate)
+        print(f"agreement check (interpolate={interpolate}): {args.scalar_rows} rows, {mismatches} mismatches")
+
+    def scalar_pass():
+        for t in sample.tolist():
+            scalar_chart(julian_date(t.year, t.month, t.day, t.hour, t.minute))
+    scalar_per_row = min(timeit.repeat(scalar_pass, number=1, repeat=args.repeat)) / args.scalar_rows
+
+    scalar_total = scalar_per_row * args.rows
+    print(f"scalar: {scalar_per_row * 1e6:.2f} us/row, ~{scalar_total:.1f} s for {args.rows} rows (extrapolated)")
+
+    times = random_minutes(args.rows)
+    print(f"batch: {args.rows} random UTC minutes over 1900-2100, one thread, NumPy {np.__version__}, "
+          f"{os.cpu_count()} CPUs; times include datetime64 to JD conversion and allocating the output")
+    for label, interpolate in (("batch, direct", False), ("batch, interpolated", True), ("batch, auto", None)):
+        best = min(timeit.repeat(lambda: batch.compute(times, interpolate=interpolate), number=1, repeat=args.repeat))
+        print(f"{label}: {best / args.rows * 1e9:.1f} ns/row, {best:.2f} s, "
+              f"speedup {scalar_total / best:.0f}x (best of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
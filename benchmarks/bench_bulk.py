@@ -0,0 +1,55 @@
+"""Throughput of the bulk chart CLI as the number of workers grows.
+
+Usage: python benchmarks/bench_bulk.py [--rows 200000] [--max-workers N]
+
+Writes a synthetic CSV of birth records to a temporary directory, runs
+vedic_bird.bulk over it with 1, 2, 4, ... workers and reports rows/s and
+the speedup relative to a single worker.
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vedic_bird import bulk
+from vedic_bird.timezones import available_timezones
+
+
+def write_input(path, rows, seed=0):
+    rng = random.Random(seed)
+    zones = [z for z in available_timezones() if "/" in z]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "birth_date", "birth_time", "timezone", "place"])
+        for i in range(rows):
+            writer.writerow([i, f"{rng.randint(1900, 2100)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                             f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}", rng.choice(zones), ""])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "births.csv")
+        write_input(src, args.rows)
+        workers, base = 1, None
+        while workers <= args.max_workers:
+            dst = os.path.join(tmp, "charts.csv")
+            t0 = time.perf_counter()
+            bulk.main([src, "-o", dst, "--workers", str(workers)])
+            rate = args.rows / (time.perf_counter() - t0)
+            base = base or rate
+            print(f"{workers:3d} workers: {rate:10,.0f} rows/s  speedup {rate / base:.2f}x")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
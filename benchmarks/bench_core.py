@@ -0,0 +1,231 @@
+"""Microbenchmarks of the astronomical core, asv style.
+
+Usage: python benchmarks/bench_core.py [--filter REGEX] [--save results.json] [--compare results.json] [--stages]
+
+Each Time* class is a suite in the layout airspeed velocity (asv) expects:
+setup() builds the inputs, every time_* method is one benchmark, and
+`params` runs a suite once per value. asv can collect this file as it is;
+run directly, it times each benchmark itself (best of several timeit
+repeats) and reports the time per call and per item. --save keeps the
+results as JSON and --compare prints the ratio to a saved run, so a
+speed-up can be checked against the golden tests in tests/ before and after.
+--stages adds a per-stage breakdown of compute_chart from chart's timing
+hook.
+"""
+import argparse
+import datetime
+import inspect
+import json
+import os
+import re
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vedic_bird import astro, batch, chart, meeus, timezones
+
+START = datetime.datetime(1900, 1, 1, tzinfo=datetime.timezone.utc)
+MINUTES = 201 * 525960  # to the end of 2100
+N = 1000
+
+
+def random_minutes(n, seed=0):
+    return np.random.default_rng(seed).integers(0, MINUTES, n)
+
+
+def random_datetimes(n, seed=0):
+    return [START + datetime.timedelta(minutes=m) for m in random_minutes(n, seed).tolist()]
+
+
+class TimeJulianDate:
+    items = N
+
+    def setup(self):
+        self.dates = [(t.year, t.month, t.day, t.hour, t.minute) for t in random_datetimes(N)]
+        # The same days in the Julian calendar branch
+        self.julian_dates = [(y - 1000, m, d, h, mi) for y, m, d, h, mi in self.dates]
+
+    def time_gregorian(self):
+        julian_date = astro.julian_date
+        for args in self.dates:
+            julian_date(*args)
+
+    def time_julian_calendar(self):
+        julian_date = astro.julian_date
+        for args in self.julian_dates:
+            julian_date(*args)
+
+
+class TimeLongitudes:
+    items = N
+
+    def setup(self):
+        self.jds = [astro.julian_date(t.year, t.month, t.day, t.hour, t.minute) for t in random_datetimes(N)]
+        self.days = [jd - 2451545.0 for jd in self.jds]
+        self.jdes = [meeus.to_jde(jd) for jd in self.jds]
+
+    def time_sun(self):
+        for d in self.days:
+            astro.calculate_sun_longitude(d)
+
+    def time_moon(self):
+        for d in self.days:
+            astro.calculate_moon_longitude(d)
+
+    def time_ayanamsa(self):
+        for jd in self.jds:
+            astro.calculate_ayanamsa(jd)
+
+    def time_meeus_sun(self):
+        for jde in self.jdes:
+            meeus.sun_longitude(jde)
+
+    def time_meeus_moon(self):
+        for jde in self.jdes:
+            meeus.moon_longitude(jde)
+
+
+class TimePositions:
+    items = N
+    params = list(chart.PRECISIONS)
+    param_names = ["precision"]
+
+    def setup(self, precision):
+        self.jds = [astro.julian_date(t.year, t.month, t.day, t.hour, t.minute) for t in random_datetimes(N)]
+        chart.positions(self.jds[0], precision)  # load the ephemeris file
+
+    def time_positions(self, precision):
+        positions = chart.positions
+        for jd in self.jds:
+            positions(jd, precision)
+
+
+class TimeChart:
+    items = N
+    params = list(chart.PRECISIONS)
+    param_names = ["precision"]
+
+    def setup(self, precision):
+        self.times = random_datetimes(N)
+        self.charts = [chart.compute_chart(t, precision) for t in self.times]
+
+    def time_compute_chart(self, precision):
+        compute_chart = chart.compute_chart
+        for t in self.times:
+            compute_chart(t, precision)
+
+    def time_describe_chart(self, precision):
+        for c in self.charts:
+            chart.describe_chart(c)
+
+
+class TimeBatch:
+    items = 100_000
+
+    def setup(self):
+        self.times = np.datetime64(START.replace(tzinfo=None), "m") + random_minutes(self.items).astype("timedelta64[m]")
+        self.jd = batch.datetime64_to_jd(self.times)
+
+    def time_datetime64_to_jd(self):
+        batch.datetime64_to_jd(self.times)
+
+    def time_compute_direct(self):
+        batch.compute_from_jd(self.jd, interpolate=False)
+
+    def time_compute_interpolated(self):
+        batch.compute_from_jd(self.jd, interpolate=True)
+
+
+class TimeTimezones:
+    items = N
+    zones = ["Asia/Kolkata", "America/New_York", "Europe/London", "Australia/Lord_Howe", "Pacific/Kiritimati"]
+
+    def setup(self):
+        rng = np.random.default_rng(0)
+        self.births = [(t.date(), t.time(), self.zones[i]) for t, i in
+                       zip(random_datetimes(N), rng.integers(0, len(self.zones), N).tolist())]
+        for zone in self.zones:
+            timezones.get_zone(zone)
+
+    def time_to_utc(self):
+        to_utc = chart.to_utc
+        for birth_date, birth_time, zone in self.births:
+            to_utc(birth_date, birth_time, zone)
+
+    def time_get_zone(self):
+        get_zone = timezones.get_zone
+        for _, _, zone in self.births:
+            get_zone(zone)
+
+
+def suites():
+    for name, cls in sorted(globals().items()):
+        if name.startswith("Time") and inspect.isclass(cls):
+            yield name, cls
+
+
+# Best seconds per call of each benchmark, as {"Suite.time_x[param]": seconds}
+def run(pattern, repeat):
+    results = {}
+    for suite_name, cls in suites():
+        for param in getattr(cls, "params", [None]):
+            args = () if param is None else (param,)
+            suite = cls()
+            suite.setup(*args)
+            for method in sorted(m for m in dir(cls) if m.startswith("time_")):
+                name = f"{suite_name}.{method}" + ("" if param is None else f"[{param}]")
+                if not re.search(pattern, name):
+                    continue
+                func = getattr(suite, method)
+                timer = timeit.Timer(lambda: func(*args))
+                number, _ = timer.autorange()
+                results[name] = min(timer.repeat(repeat=repeat, number=number)) / number
+                per_item = results[name] / cls.items
+                print(f"{name:48s} {results[name] * 1e3:10.3f} ms/call {per_item * 1e9:10.1f} ns/item", flush=True)
+    return results
+
+
+def stages(n=20000):
+    times = random_datetimes(n)
+    for precision in chart.PRECISIONS:
+        chart.compute_chart(times[0], precision)
+        timings = chart.StageTimings()
+        previous = chart.set_timing_hook(timings)
+        try:
+            for t in times:
+                chart.compute_chart(t, precision)
+        finally:
+            chart.set_timing_hook(previous)
+        print(f"\ncompute_chart stages, {precision}")
+        print(timings.report())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="only benchmarks whose name matches this regex")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file from an earlier --save to compare against")
+    parser.add_argument("--stages", action="store_true", help="also report per-stage compute_chart timings")
+    args = parser.parse_args()
+
+    results = run(args.filter, args.repeat)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\nagainst {args.compare} (< 1 is faster)")
+        for name, seconds in results.items():
+            if name in baseline:
+                print(f"{name:48s} {seconds / baseline[name]:6.2f}x")
+    if args.stages:
+        stages()
+
+
+if __name__ == "__main__":
+    main()
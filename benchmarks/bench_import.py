@@ -0,0 +1,65 @@
+"""Measure the import time of the computation core with ``python -X importtime``.
+
+Usage: python benchmarks/bench_import.py [--module vedic_bird.chart] [--runs 5] [--budget-ms 50]
+
+Reports the best cumulative import time over several fresh interpreters and
+fails if it exceeds the budget or if Streamlit/NumPy get imported.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FORBIDDEN = ("streamlit", "numpy")
+
+
+# Parse -X importtime output into {module: (cumulative microseconds, depth)}
+def import_times(statement):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times[name.strip()] = (int(cumulative), depth)
+    return times
+
+
+# Total cost of the statement: top-level imports not already done at startup
+def total_us(times, startup):
+    return sum(us for name, (us, depth) in times.items() if depth == 0 and name not in startup)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="vedic_bird.chart")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    startup = import_times("pass")
+    runs = [import_times(f"import {args.module}") for _ in range(args.runs)]
+    best = min(runs, key=lambda t: total_us(t, startup))
+    total = total_us(best, startup)
+
+    for name, (us, depth) in best.items():
+        if name not in startup and depth <= 1:
+            print(f"{us / 1000:8.2f} ms  {'  ' * depth}{name}")
+    print(f"total: {total / 1000:.2f} ms (budget {args.budget_ms:.0f} ms)")
+
+    pulled_in = [m for m in FORBIDDEN if m in best]
+    if pulled_in:
+        print(f"FAIL: importing {args.module} pulled in {', '.join(pulled_in)}")
+        sys.exit(1)
+    if total / 1000 > args.budget_ms:
+        print("FAIL: over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
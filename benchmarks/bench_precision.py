@@ -0,0 +1,121 @@
+"""Speed and accuracy of the chart precision tiers.
+
+Usage: python benchmarks/bench_precision.py [--samples N]
+
+Accuracy is measured at random minutes over 1900-2100 against the Swiss
+Ephemeris (pip install pyswisseph; its built-in Moshier ephemeris needs no
+data files) with Lahiri ayanamsa. Without it the "precise" tier stands in as
+the reference, which says nothing about that tier itself.
+
+For each tier the report gives the 99th percentile and worst error of the
+sidereal moon longitude and of the sun-moon elongation, the share of charts
+whose nakshatra, pada, rashi or paksha differ from the reference, the share
+flagged near_boundary, and how many of the differing charts were not
+flagged (this should be 0).
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vedic_bird import chart
+from vedic_bird.astro import julian_date
+
+START = datetime.datetime(1900, 1, 1, tzinfo=datetime.timezone.utc)
+END = datetime.datetime(2101, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def swiss_reference():
+    try:
+        import swisseph as swe
+    except ImportError:
+        return None
+    swe.set_sid_mode(swe.SIDM_LAHIRI)
+
+    # Positions without nutation, as the tiers compute them
+    def reference(jd):
+        sun = swe.calc_ut(jd, swe.SUN, swe.FLG_MOSEPH | swe.FLG_NONUT)[0][0]
+        moon = swe.calc_ut(jd, swe.MOON, swe.FLG_MOSEPH | swe.FLG_NONUT)[0][0]
+        sid_moon = swe.calc_ut(jd, swe.MOON, swe.FLG_MOSEPH | swe.FLG_SIDEREAL)[0][0]
+        return sid_moon, (moon - sun) % 360
+    return reference
+
+
+def tier_reference(precision):
+    def reference(jd):
+        sun, moon, ayan = chart.positions(jd, precision)
+        return (moon - ayan) % 360, (moon - sun) % 360
+    return reference
+
+
+def discrete(sid_moon, elong):
+    return int(sid_moon // (360 / 108)), elong >= 180
+
+
+def angle_error(a, b):
+    return abs((a - b + 180) % 360 - 180) * 3600
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def accuracy(precision, times, reference):
+    moon_errors, elong_errors = [], []
+    mismatched = flagged = missed = 0
+    for utc_dt, ref in zip(times, reference):
+        c = chart.compute_chart(utc_dt, precision)
+        elong = (c["moon_long"] - c["sun_long"]) % 360
+        moon_errors.append(angle_error(c["sid_moon"], ref[0]))
+        elong_errors.append(angle_error(elong, ref[1]))
+        differs = discrete(c["sid_moon"], elong) != discrete(*ref)
+        mismatched += differs
+        flagged += c["near_boundary"]
+        missed += differs and not c["near_boundary"]
+    n = len(times)
+    print(f"{precision:>10}: sid moon p99 {percentile(moon_errors, 0.99):8.2f}\" max {max(moon_errors):8.2f}\" | "
+          f"elongation p99 {percentile(elong_errors, 0.99):8.2f}\" max {max(elong_errors):8.2f}\" | "
+          f"differ {mismatched / n:7.3%} flagged {flagged / n:7.3%} unflagged differences {missed}")
+
+
+def speed(precision, times):
+    jd = julian_date(1990, 5, 17, 3, 0)
+    chart.positions(jd, precision)  # load the ephemeris file outside the timing
+    n = 20000
+    positions = min(timeit.repeat(lambda: chart.positions(jd, precision), number=n, repeat=5)) / n
+    sample = times[:n]
+    t = min(timeit.repeat(lambda: [chart.compute_chart(utc_dt, precision) for utc_dt in sample], number=1, repeat=3))
+    print(f"{precision:>10}: positions {positions * 1e6:6.2f} us, compute_chart {t / len(sample) * 1e6:6.2f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    times = [START + datetime.timedelta(minutes=rng.randrange((END - START) // datetime.timedelta(minutes=1))) for _ in range(args.samples)]
+
+    print("speed")
+    for precision in chart.PRECISIONS:
+        speed(precision, times)
+
+    reference = swiss_reference()
+    if reference is None:
+        print("\naccuracy against the precise tier (pyswisseph not installed)")
+        reference = tier_reference("precise")
+    else:
+        print("\naccuracy against the Swiss Ephemeris")
+    refs = [reference(julian_date(t.year, t.month, t.day, t.hour, t.minute)) for t in times]
+    for precision in chart.PRECISIONS:
+        accuracy(precision, times, refs)
+
+
+if __name__ == "__main__":
+    main()
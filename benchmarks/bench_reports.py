@@ -0,0 +1,88 @@
+"""Report rendering against plain file writes.
+
+Usage: python benchmarks/bench_reports.py [--reports 1000000] [--charts 20000]
+
+Charts are computed once for --charts random minutes and cycled, each copy
+with its own time and place, to make --reports records; chart computation is
+bench_batch's business. For each format the report gives the rate of
+rendering alone, of writing the rendered text to a file alone, and of
+write_reports doing both, along with the output size. Rendering should take
+no longer than the write.
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vedic_bird import reports
+from vedic_bird.chart import compute_chart
+
+START = datetime.datetime(1900, 1, 1, tzinfo=datetime.timezone.utc)
+BATCH = 1024
+PLACES = ["Chennai", "Madurai", "London", "New York", "Tokyo", "Zürich", "São Paulo", "Rock & Roll <City>"]
+
+
+def make_records(n, charts, seed=0):
+    rng = random.Random(seed)
+    base = []
+    for _ in range(charts):
+        utc_dt = START + datetime.timedelta(minutes=rng.randrange(200 * 525960))
+        chart = compute_chart(utc_dt)
+        chart["utc"] = utc_dt.strftime("%Y-%m-%d %H:%M UTC")
+        base.append(chart)
+    records = []
+    for i in range(n):
+        record = dict(base[i % charts])
+        record["place"] = PLACES[i % len(PLACES)]
+        records.append(record)
+    return records
+
+
+def timed(func):
+    t0 = time.perf_counter()
+    result = func()
+    return time.perf_counter() - t0, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=1_000_000)
+    parser.add_argument("--charts", type=int, default=20_000)
+    args = parser.parse_args()
+
+    records = make_records(args.reports, args.charts)
+    n = len(records)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "reports")
+        for fmt in reports.FORMATS:
+            template = reports.template(fmt)
+            template.cache.clear()
+            render_s, size = timed(lambda: sum(map(len, reports.iter_reports(records, fmt, seed=1))))
+
+            # The same amount of text, written in the same batches. Each write
+            # gets a fresh copy, as str caches its UTF-8 encoding.
+            head, tail = "".join(reports.iter_reports(records[:BATCH], fmt, seed=1)), "\n"
+
+            def write_only():
+                with open(path, "w", encoding="utf-8") as f:
+                    for _ in range(n // BATCH):
+                        f.write(head + tail)
+            write_s, _ = timed(write_only)
+
+            def both():
+                with open(path, "w", encoding="utf-8") as f:
+                    reports.write_reports(records, f, fmt, seed=1, batch_size=BATCH)
+            both_s, _ = timed(both)
+
+            mb = os.path.getsize(path) / 2**20
+            print(f"{fmt:>9}: render {n / render_s:10,.0f}/s | write {n / write_s:10,.0f}/s | "
+                  f"render+write {n / both_s:10,.0f}/s ({mb / both_s:6.1f} MB/s) | "
+                  f"{mb:7.1f} MB, {len(template.cache)} cached blocks, {size / n:.0f} chars/report")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Time vedic_bird.search over 200 years and check it against compute_chart.
+
+Usage: python benchmarks/bench_search.py [--samples N]
+
+For every query, each interval's first and last minute must meet the
+constraints and the minutes just outside it must not, and random minutes
+across the range must be inside an interval exactly when compute_chart says
+they match.
+"""
+import argparse
+import bisect
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vedic_bird.chart import compute_chart
+from vedic_bird.search import find_intervals
+
+START = datetime.datetime(1900, 1, 1, tzinfo=datetime.timezone.utc)
+END = datetime.datetime(2100, 1, 1, tzinfo=datetime.timezone.utc)
+MINUTE = datetime.timedelta(minutes=1)
+
+QUERIES = [
+    {"nakshatra": "Rohini", "pada": 2, "paksha": "Krishna"},
+    {"ruling_bird": "Peacock", "siddha_force": "Peacock-Earth", "paksha": "Krishna"},
+    {"rashi": "Meena"},
+    {"paksha": "Shukla"},
+    {"nakshatra": ["Ashwini", "Magha", "Mula"], "pada": 1},
+    {"ruling_bird": "Vulture", "siddha_force": "Peacock-Earth"},  # never both: empty
+]
+
+
+def matches(utc_dt, query):
+    chart = compute_chart(utc_dt)
+    fields = {"nakshatra": chart["nak_name"], "pada": chart["pada"], "rashi": chart["rashi_name"],
+              "paksha": chart["paksha"], "ruling_bird": chart["ruling_bird"],
+              "siddha_force": chart["siddha_force"].split(" ")[0]}
+    for key, want in query.items():
+        want = {want} if isinstance(want, (str, int)) else set(want)
+        if fields[key] not in want:
+            return False
+    return True
+
+
+def check(query, intervals, samples, rng):
+    errors = 0
+    for start, end in intervals:
+        errors += not matches(start, query) or not matches(end - MINUTE, query)
+        errors += start > START and matches(start - MINUTE, query)
+        errors += end < END and matches(end, query)
+    starts = [start for start, _ in intervals]
+    for _ in range(samples):
+        t = START + rng.randrange((END - START) // MINUTE) * MINUTE
+        i = bisect.bisect_right(starts, t) - 1
+        inside = i >= 0 and t < intervals[i][1]
+        errors += inside != matches(t, query)
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=2000, help="random minutes checked per query")
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    find_intervals(START, START + datetime.timedelta(days=30), paksha="Shukla")  # warm up NumPy
+    for query in QUERIES:
+        t0 = time.perf_counter()
+        intervals = find_intervals(START, END, **query)
+        elapsed = time.perf_counter() - t0
+        errors = check(query, intervals, args.samples, rng)
+        print(f"{elapsed * 1e3:7.1f} ms  {len(intervals):6d} intervals  {errors} errors  {query}")
+
+
+if __name__ == "__main__":
+    main()
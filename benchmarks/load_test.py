@@ -0,0 +1,102 @@
+"""Load test for the chart HTTP service, cached vs uncached.
+
+Usage: python benchmarks/load_test.py [--requests 20000] [--concurrency 50] [--distinct 2000]
+
+Starts vedic_bird.service in-process twice, once with the LRU cache and
+request coalescing and once with both disabled, and drives each with the
+same keep-alive client load: requests for --distinct birth minutes with a
+Zipf-like popularity, as real traffic repeats popular dates. Prints
+throughput, latency quantiles and the server's /metrics.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vedic_bird.service import ChartService
+
+
+def make_targets(n, distinct, seed=0):
+    rng = random.Random(seed)
+    pool = [f"/chart?utc={rng.randint(1900, 2100)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            f"T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}" for _ in range(distinct)]
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    return rng.choices(pool, weights, k=n)
+
+
+async def fetch(reader, writer, target):
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    status = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        if line == b"\r\n":
+            break
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":")[1])
+    body = await reader.readexactly(length)
+    return status, body
+
+
+async def client(port, targets, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for target in targets:
+        t0 = time.perf_counter()
+        status, _ = await fetch(reader, writer, target)
+        latencies.append(time.perf_counter() - t0)
+        assert b" 200 " in status, status
+    writer.close()
+
+
+async def run(label, cache_size, targets, concurrency, processes):
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+        service = ChartService(cache_size=cache_size, executor=executor, coalesce=cache_size > 0)
+        server = await service.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        # Warm the worker processes up so both runs start equal
+        await asyncio.gather(*(loop_call(executor) for _ in range(processes)))
+
+        latencies = []
+        t0 = time.perf_counter()
+        await asyncio.gather(*(client(port, targets[i::concurrency], latencies) for i in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+        server.close()
+        await server.wait_closed()
+
+    latencies.sort()
+    rate = len(targets) / elapsed
+    print(f"{label}: {rate:,.0f} req/s, p50 {latencies[len(latencies) // 2] * 1e3:.2f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1e3:.2f} ms")
+    print("  " + service.metrics.render().strip().replace("\n", "\n  "))
+    return rate
+
+
+async def loop_call(executor):
+    from vedic_bird.service import chart_for_minute
+    await asyncio.get_running_loop().run_in_executor(executor, chart_for_minute, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--distinct", type=int, default=2_000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    targets = make_targets(args.requests, args.distinct)
+    uncached = asyncio.run(run("uncached", 0, targets, args.concurrency, args.processes))
+    cached = asyncio.run(run("cached", 100_000, targets, args.concurrency, args.processes))
+    print(f"throughput gain: {cached / uncached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
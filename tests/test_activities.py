@@ -0,0 +1,73 @@
+"""Sunrise and sunset, and the shape of the activity timeline."""
+import datetime
+
+import pytest
+
+from vedic_bird import activities
+
+CHENNAI = (13.08, 80.27, "Asia/Kolkata")
+
+# Local date, (lat, lon, zone), published sunrise and sunset (local, to the
+# minute; almanac values for the upper limb at the standard -0.833 degrees)
+SUN_TIMES = [
+    ("2024-06-21", (51.5074, -0.1278, "Europe/London"), "04:43", "21:21"),
+    ("2024-06-21", (40.7128, -74.0060, "America/New_York"), "05:25", "20:31"),
+    ("2024-12-21", (-33.8688, 151.2093, "Australia/Sydney"), "05:41", "20:05"),
+    ("2024-01-01", CHENNAI, "06:30", "17:52"),
+]
+
+
+def _local(jd, zone):
+    return (activities._EPOCH + datetime.timedelta(days=jd - activities._UNIX_EPOCH_JD)).astimezone(activities.get_zone(zone))
+
+
+@pytest.mark.parametrize("date, place, sunrise, sunset", SUN_TIMES)
+def test_sun_rise_set(date, place, sunrise, sunset):
+    lat, lon, zone = place
+    day = datetime.date.fromisoformat(date)
+    for jd, expected in zip(activities.sun_rise_set(day, lat, lon), (sunrise, sunset)):
+        got = _local(jd, zone)
+        want = datetime.datetime.combine(day, datetime.time.fromisoformat(expected), got.tzinfo)
+        assert got.date() == day
+        assert abs(got - want) <= datetime.timedelta(minutes=1), (got, expected)
+
+
+def test_periods_per_day_and_contiguity():
+    start = datetime.date(2024, 3, 1)
+    periods = list(activities.activity_periods(start, start + datetime.timedelta(days=2), *CHENNAI))
+    assert len(periods) == 3 * 250
+
+    for date in (start + datetime.timedelta(days=n) for n in range(3)):
+        day = [p for p in periods if p.date == date]
+        assert len(day) == 250
+        next_rise, _ = activities.sun_rise_set(date + datetime.timedelta(days=1), *CHENNAI[:2])
+        night_end = max(p.end for p in day if p.part == "night")
+        assert abs(night_end - _local(next_rise, CHENNAI[2])) < datetime.timedelta(minutes=1)
+
+        for bird in {p.bird for p in day}:
+            for part in ("day", "night"):
+                subs = [p for p in day if p.bird == bird and p.part == part]
+                assert len(subs) == 25
+                for a, b in zip(subs, subs[1:]):
+                    assert a.end == b.start
+                    assert a.start < a.end
+
+    # Each night ends at the sunrise the next day starts from
+    for date in (start, start + datetime.timedelta(days=1)):
+        night_end = max(p.end for p in periods if p.date == date)
+        next_start = min(p.start for p in periods if p.date == date + datetime.timedelta(days=1))
+        assert night_end == next_start
+
+
+def test_birds_filter():
+    start = datetime.date(2024, 3, 1)
+    all_periods = list(activities.activity_periods(start, start, *CHENNAI))
+    bird = all_periods[0].bird
+    only = list(activities.activity_periods(start, start, *CHENNAI, birds={bird}))
+    assert len(only) == 50
+    assert only == [p for p in all_periods if p.bird == bird]
+
+
+def test_polar_day_raises():
+    with pytest.raises(ValueError):
+        next(activities.activity_periods(datetime.date(2024, 6, 21), datetime.date(2024, 6, 21), 78.22, 15.65, "Arctic/Longyearbyen"))
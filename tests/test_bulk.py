@@ -0,0 +1,37 @@
+"""Malformed rows in the bulk CLI's worker."""
+import csv
+import io
+
+from vedic_bird import bulk
+
+FIELDNAMES = ["birth_date", "birth_time", "timezone", "place"]
+
+
+def test_chart_chunk_marks_bad_rows():
+    rows = [
+        ["1990-05-17", "08:30", "Asia/Kolkata", "Chennai"],
+        ["1990-13-01", "08:30", "UTC", "bad date"],
+        ["1990-05-17", "08:30", "Nowhere/Zone", "unknown zone"],
+        ["1990-05-17"],  # short row
+        ["0001-01-01", "00:10", "Asia/Tokyo", "before year 1 in UTC"],
+    ]
+    text = bulk.chart_chunk((FIELDNAMES, rows, "csv", "fast"))
+    out = [dict(zip(FIELDNAMES + bulk.RESULT_FIELDS, row)) for row in csv.reader(io.StringIO(text))]
+    assert len(out) == len(rows)
+    assert out[0]["error"] == "" and out[0]["nakshatra"] == "Dhanishta"
+    assert out[1]["error"].startswith("ValueError")
+    assert out[2]["error"].startswith("ZoneInfoNotFoundError")
+    assert out[3]["error"].startswith("ValueError") and out[3]["place"] == ""
+    assert out[4]["error"].startswith("OverflowError")
+    for row in out[1:]:
+        assert row["nakshatra"] == "" and row["pada"] == ""
+
+
+def test_read_csv_with_byte_order_mark(tmp_path):
+    path = tmp_path / "births.csv"
+    path.write_text("birth_date,birth_time,timezone,place\n1990-05-17,08:30,Asia/Kolkata,Chennai\n", encoding="utf-8-sig")
+    fieldnames, chunks = bulk.read_csv(str(path), 10)
+    assert fieldnames == FIELDNAMES
+    text = "".join(bulk.chart_chunk((names, rows, "csv", "fast")) for names, rows in chunks)
+    out = dict(zip(FIELDNAMES + bulk.RESULT_FIELDS, next(csv.reader(io.StringIO(text)))))
+    assert out["error"] == "" and out["nakshatra"] == "Dhanishta"
@@ -0,0 +1,200 @@
+"""Golden values for the astronomical core, 1900-2100.
+
+The chart values were produced by the code as it stood when they were
+recorded; a change that moves any of them changes results, whether or not it
+was meant to. julian_date is checked against the worked examples in Meeus,
+Astronomical Algorithms, ch. 7, across the Julian/Gregorian cutover.
+"""
+import datetime
+
+import numpy as np
+import pytest
+
+from vedic_bird import astro, batch, chart, tables
+
+# Longitudes are recorded to 1e-9 degrees
+TOLERANCE = 1e-8
+
+JULIAN_DATES = [
+    ((2000, 1, 1, 12), 2451545.0),
+    ((1987, 1, 27), 2446822.5),
+    ((1987, 6, 19, 12), 2446966.0),
+    ((1988, 1, 27), 2447187.5),
+    ((1988, 6, 19, 12), 2447332.0),
+    ((1900, 1, 1), 2415020.5),
+    ((1957, 10, 4, 19, 26, 24), 2436116.31),
+    ((2100, 12, 31, 23, 59), 2488434.4993055556),
+    # Gregorian branch down to its first day, 1582 October 15
+    ((1600, 1, 1), 2305447.5),
+    ((1600, 12, 31), 2305812.5),
+    ((1583, 1, 1), 2299238.5),
+    ((1582, 10, 15), 2299160.5),
+    # Julian branch: October 4, 1582 is the day before October 15
+    ((1582, 10, 4), 2299159.5),
+    ((1582, 2, 28), 2298941.5),
+    ((837, 4, 10, 7, 12), 2026871.8),
+    ((333, 1, 27, 12), 1842713.0),
+    ((-1000, 7, 12, 12), 1356001.0),
+    ((-4712, 1, 1, 12), 0.0),
+]
+
+# UTC minute, (nak_num, pada, rashi_num, paksha, ruling bird, Siddha force),
+# then (sun longitude, moon longitude, ayanamsa) for each of chart.PRECISIONS.
+CHARTS = [
+    ("1900-01-01 00:00", (18, 3, 8, "Krishna", "Owl", "Owl-Air"),
+     (278.624858507, 272.412673612, 22.45657745), (280.148528682, 272.411808018, 22.460530317), (280.148524866, 272.411808343, 22.460530318)),
+    ("1907-07-02 11:26", (25, 4, 11, "Krishna", "Vulture", "Vulture-Ether"),
+     (97.996345943, 7.874582209, 22.561276218), (99.419966778, 7.83695594, 22.56521823), (99.419968042, 7.836956493, 22.565218227)),
+    ("1912-11-24 12:20", (2, 4, 1, "Shukla", "Vulture", "Vulture-Ether"),
+     (240.36735519, 59.850077354, 22.636672121), (241.877139716, 59.805541633, 22.640608453), (241.877137497, 59.805540546, 22.640608446)),
+    ("1929-03-23 03:35", (9, 4, 4, "Shukla", "Owl", "Owl-Air"),
+     (0.549262547, 154.908293212, 22.864638515), (2.028858875, 154.877461579, 22.868568554), (2.028859222, 154.877462822, 22.868568544)),
+    ("1934-11-05 11:31", (13, 2, 5, "Krishna", "Crow", "Crow-Fire"),
+     (220.865416879, 201.187789095, 22.943142453), (222.364255142, 201.208599995, 22.947074112), (222.364257949, 201.20859897, 22.947074101)),
+    ("1943-03-12 06:13", (3, 1, 1, "Shukla", "Vulture", "Vulture-Ether"),
+     (349.314028916, 63.349525489, 23.059704869), (350.803433722, 63.409084333, 23.063642513), (350.803433761, 63.409084122, 23.063642501)),
+    ("1956-07-16 22:32", (15, 2, 6, "Shukla", "Crow", "Crow-Fire"),
+     (112.893625325, 228.768433673, 23.246114247), (114.317890084, 228.695114292, 23.250070354), (114.317893877, 228.695114154, 23.25007034)),
+    ("1964-03-25 00:36", (9, 2, 4, "Shukla", "Owl", "Owl-Air"),
+     (2.923419332, 147.191482538, 23.353474369), (4.403023589, 147.179857712, 23.357446076), (4.40302111, 147.179857391, 23.35744606)),
+    ("1978-07-04 00:02", (4, 3, 2, "Krishna", "Peacock", "Peacock-Earth"),
+     (100.256895187, 86.224064397, 23.552817664), (101.677815923, 86.262906021, 23.556827966), (101.677816487, 86.262905818, 23.556827945)),
+    ("1983-11-29 04:46", (11, 3, 5, "Krishna", "Crow", "Crow-Fire"),
+     (244.878857913, 179.216119162, 23.628296138), (246.389386193, 179.314976349, 23.632324319), (246.389389976, 179.314975937, 23.632324296)),
+    ("1997-12-12 19:34", (3, 1, 1, "Shukla", "Vulture", "Vulture-Ether"),
+     (259.304839626, 64.084137072, 23.824337687), (260.821188548, 64.104407474, 23.828420687), (260.82118958, 64.104406833, 23.828420659)),
+    ("2000-01-01 12:00", (14, 4, 6, "Krishna", "Crow", "Crow-Fire"),
+     (278.852616041, 223.267521343, 23.853), (280.372813473, 223.327596095, 23.857092028), (280.372812901, 223.327596089, 23.857092)),
+    ("2005-08-25 04:53", (1, 3, 0, "Krishna", "Peacock", "Peacock-Earth"),
+     (150.659427793, 45.049545715, 23.931862288), (152.094623892, 45.020426568, 23.935980493), (152.094620892, 45.020425287, 23.935980464)),
+    ("2016-08-19 15:08", (23, 4, 10, "Krishna", "Vulture", "Vulture-Ether"),
+     (145.62136266, 343.204284247, 24.085267363), (147.052372678, 343.243876972, 24.089442099), (147.052371061, 343.243876039, 24.089442068)),
+    ("2028-05-29 21:58", (8, 3, 3, "Shukla", "Owl", "Owl-Air"),
+     (67.604902345, 140.575455754, 24.249716185), (69.036504118, 140.539563349, 24.253959753), (69.036504168, 140.539563881, 24.253959719)),
+    ("2039-10-27 10:17", (23, 3, 10, "Shukla", "Peacock", "Peacock-Earth"),
+     (212.367881315, 340.769002606, 24.409050588), (213.86051604, 340.781523663, 24.413368972), (213.860517042, 340.781523435, 24.413368935)),
+    ("2043-06-24 16:23", (20, 2, 9, "Krishna", "Owl", "Owl-Air"),
+     (91.651117858, 296.892158938, 24.460138911), (93.076710557, 296.921996064, 24.464482977), (93.076710585, 296.921996251, 24.464482939)),
+    ("2054-12-09 03:19", (25, 3, 11, "Shukla", "Peacock", "Peacock-Earth"),
+     (255.738517909, 7.810498436, 24.620159295), (257.25666662, 7.786025949, 24.624589126), (257.256665227, 7.78602557, 24.62458908)),
+    ("2068-09-03 01:12", (15, 2, 6, "Shukla", "Crow", "Crow-Fire"),
+     (159.943941952, 230.015991956, 24.811968321), (161.392514394, 230.029329891, 24.816511585), (161.392514956, 230.029329473, 24.816511527)),
+    ("2075-04-08 18:42", (20, 2, 9, "Krishna", "Owl", "Owl-Air"),
+     (17.603144187, 297.510101081, 24.904060033), (19.072813583, 297.537822525, 24.908661877), (19.072811464, 297.537824079, 24.908661812)),
+    ("2088-04-13 10:29", (19, 3, 8, "Krishna", "Owl", "Owl-Air"),
+     (23.016725768, 286.135821328, 25.085804197), (24.480752242, 286.185234059, 25.090529486), (24.4807519, 286.185234474, 25.090529408)),
+    ("2091-03-11 23:55", (17, 2, 7, "Krishna", "Owl", "Owl-Air"),
+     (350.164671428, 257.925485489, 25.1264285), (351.662595371, 257.940637907, 25.131182804), (351.662598485, 257.94063701, 25.131182724)),
+    ("2099-05-31 06:47", (14, 1, 6, "Shukla", "Crow", "Crow-Fire"),
+     (68.759537239, 212.920459199, 25.241213371), (70.196612372, 212.861640402, 25.246052469), (70.196609942, 212.861640427, 25.24605238)),
+    ("2100-12-31 23:59", (20, 1, 8, "Shukla", "Cock", "Cock-Water"),
+     (278.8326302, 293.837229757, 25.263377382), (280.362409437, 293.957061636, 25.268233331), (280.362406884, 293.957059075, 25.268233241)),
+]
+
+TIMEZONES = [
+    ("1990-05-17", "08:30", "Asia/Kolkata", "1990-05-17T03:00:00+00:00"),
+    ("1900-01-01", "00:00", "Asia/Kolkata", "1899-12-31T18:38:50+00:00"),  # local mean time
+    ("1945-08-15", "09:00", "Asia/Tokyo", "1945-08-15T00:00:00+00:00"),
+    ("2021-11-07", "01:30", "America/New_York", "2021-11-07T05:30:00+00:00"),  # repeated hour: first
+    ("2021-03-14", "02:30", "America/New_York", "2021-03-14T07:30:00+00:00"),  # skipped hour
+    ("2050-07-01", "12:00", "Australia/Lord_Howe", "2050-07-01T01:30:00+00:00"),
+    ("2099-12-31", "23:59", "Pacific/Kiritimati", "2099-12-31T09:59:00+00:00"),
+]
+
+
+def _utc(text):
+    return datetime.datetime.fromisoformat(text).replace(tzinfo=datetime.timezone.utc)
+
+
+@pytest.mark.parametrize("args, expected", JULIAN_DATES)
+def test_julian_date(args, expected):
+    assert astro.julian_date(*args) == pytest.approx(expected, abs=1e-9)
+
+
+def test_julian_date_cutover_is_continuous():
+    assert astro.julian_date(1582, 10, 15) - astro.julian_date(1582, 10, 4) == 1
+
+
+@pytest.mark.parametrize("args, expected", JULIAN_DATES)
+def test_batch_julian_date(args, expected):
+    assert batch.julian_date(*args) == pytest.approx(expected, abs=1e-9)
+
+
+# numpy's calendar is proleptic Gregorian; datetime64_to_jd has its own
+# route for dates before the cutover
+def test_datetime64_to_jd_across_cutover():
+    times = np.array(["1582-10-04T00:00", "1582-10-15T00:00", "1582-02-28T00:00", "1900-01-01T00:00"], dtype="datetime64[m]")
+    assert batch.datetime64_to_jd(times).tolist() == [2299159.5, 2299160.5, 2298941.5, 2415020.5]
+
+
+# Calendar units and multiples of a unit convert like the same instants in
+# datetime64[m]
+@pytest.mark.parametrize("unit", ["Y", "M", "W", "D", "2D", "7h", "s"])
+def test_datetime64_to_jd_units(unit):
+    times = np.array(["2024-03-01", "1582-10-15", "1500-07-01"], dtype="datetime64[D]").astype(f"datetime64[{unit}]")
+    assert batch.datetime64_to_jd(times).tolist() == batch.datetime64_to_jd(times.astype("datetime64[m]")).tolist()
+
+
+# The shipped ephemeris file must cover the app's range, as the transition
+# index does; past its end the "chebyshev" tier quietly becomes "precise"
+def test_ephemeris_covers_app_range():
+    from vedic_bird import ephemeris
+
+    eph = ephemeris.load()
+    assert eph.start_jd <= astro.julian_date(1899, 12, 31, 0, 0)
+    assert eph.end_jd >= astro.julian_date(2101, 1, 2, 0, 0)
+
+
+@pytest.mark.parametrize("utc, state, fast, precise, chebyshev", CHARTS)
+def test_positions(utc, state, fast, precise, chebyshev):
+    utc_dt = _utc(utc)
+    jd = astro.julian_date(utc_dt.year, utc_dt.month, utc_dt.day, utc_dt.hour, utc_dt.minute)
+    for precision, expected in zip(chart.PRECISIONS, (fast, precise, chebyshev)):
+        assert chart.positions(jd, precision) == pytest.approx(expected, abs=TOLERANCE), precision
+
+
+@pytest.mark.parametrize("utc, state, fast, precise, chebyshev", CHARTS)
+def test_longitude_functions(utc, state, fast, precise, chebyshev):
+    utc_dt = _utc(utc)
+    jd = astro.julian_date(utc_dt.year, utc_dt.month, utc_dt.day, utc_dt.hour, utc_dt.minute)
+    d = jd - 2451545.0
+    assert astro.calculate_sun_longitude(d) == pytest.approx(fast[0], abs=TOLERANCE)
+    assert astro.calculate_moon_longitude(d) == pytest.approx(fast[1], abs=TOLERANCE)
+    assert astro.calculate_ayanamsa(jd) == pytest.approx(fast[2], abs=TOLERANCE)
+
+
+@pytest.mark.parametrize("utc, state, fast, precise, chebyshev", CHARTS)
+def test_compute_chart(utc, state, fast, precise, chebyshev):
+    nak_num, pada, rashi_num, paksha, bird, force = state
+    c = chart.compute_chart(_utc(utc))
+    assert (c["nak_num"], c["pada"], c["rashi_num"], c["paksha"]) == (nak_num, pada, rashi_num, paksha)
+    assert c["nak_name"] == tables.nakshatras[nak_num]
+    assert c["rashi_name"] == tables.rashis[rashi_num]
+    assert c["ruling_bird"] == bird
+    assert c["siddha_force"].split(" ")[0] == force
+    assert c["element"] == tables.bird_to_element[bird]
+    assert c["string_type"] == tables.element_to_string[c["element"]]
+    assert c["sanskrit_name"] == tables.bird_to_sanskrit[bird]
+
+
+@pytest.mark.parametrize("interpolate", [False, True])
+def test_batch_matches_golden(interpolate):
+    times = np.array([utc for utc, *_ in CHARTS], dtype="datetime64[m]")
+    res = batch.compute(times, interpolate=interpolate)
+    for i, (utc, state, fast, precise, chebyshev) in enumerate(CHARTS):
+        nak_num, pada, rashi_num, paksha, bird, force = state
+        assert (res["nak_num"][i], res["pada"][i], res["rashi_num"][i]) == (nak_num, pada, rashi_num), utc
+        assert batch.PAKSHAS[res["paksha"][i]] == paksha, utc
+        assert tables.BIRDS[res["bird"][i]] == bird, utc
+        assert tables.SIDDHA_FORCES[res["siddha_force"][i]].split(" ")[0] == force, utc
+        assert (res["sun_long"][i], res["moon_long"][i]) == pytest.approx(fast[:2], abs=TOLERANCE), utc
+
+
+@pytest.mark.parametrize("date, time, zone, expected", TIMEZONES)
+def test_to_utc(date, time, zone, expected):
+    utc_dt = chart.to_utc(datetime.date.fromisoformat(date), datetime.time.fromisoformat(time), zone)
+    assert utc_dt.isoformat() == expected
+
+
+def test_tables_consistent():
+    assert [message for level, message in tables.check_consistency() if level == "error"] == []
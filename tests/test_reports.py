@@ -0,0 +1,22 @@
+"""Report rendering from rows, as the reports CLI's workers do it."""
+from vedic_bird import reports
+
+FIELDNAMES = ["birth_date", "birth_time", "timezone", "place"]
+ROWS = [
+    ["1990-05-17", "08:30", "Asia/Kolkata", "Chennai & <Madras>"],
+    ["0001-01-01", "00:10", "Asia/Tokyo", "before year 1 in UTC"],
+    ["1990-05-17", "08:30", "Nowhere/Zone", "unknown zone"],
+]
+
+
+def test_report_chunk_counts_bad_rows():
+    text, errors = reports.report_chunk((FIELDNAMES, ROWS, "html", 7, "fast"))
+    assert errors == 2
+    assert text.count("<section>") == 1
+    assert "Chennai &amp; &lt;Madras&gt;" in text
+
+
+def test_same_seed_same_output():
+    first = reports.report_chunk((FIELDNAMES, ROWS[:1] * 3, "jsonl", 7, "fast"))
+    second = reports.report_chunk((FIELDNAMES, ROWS[:1] * 3, "jsonl", 7, "fast"))
+    assert first == second
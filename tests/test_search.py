@@ -0,0 +1,75 @@
+"""find_intervals against compute_chart over a short range.
+
+As in benchmarks/bench_search.py: every interval's first and last minute
+meet the constraints and the minutes just outside it do not, and random
+minutes are inside an interval exactly when compute_chart says they match.
+"""
+import bisect
+import datetime
+import random
+
+import pytest
+
+from vedic_bird.chart import compute_chart
+from vedic_bird.search import find_intervals
+
+START = datetime.datetime(2024, 10, 1, 7, 13, tzinfo=datetime.timezone.utc)
+END = START + datetime.timedelta(days=60)
+MINUTE = datetime.timedelta(minutes=1)
+SAMPLES = 300
+
+QUERIES = [
+    {"nakshatra": "Rohini", "pada": 2},
+    {"ruling_bird": "Peacock", "siddha_force": "Peacock-Earth", "paksha": "Krishna"},
+    {"rashi": "Meena"},
+    {"paksha": "Shukla"},
+    {"nakshatra": ["Ashwini", "Magha", "Mula"], "pada": 1},
+]
+
+
+def matches(utc_dt, query):
+    chart = compute_chart(utc_dt)
+    fields = {"nakshatra": chart["nak_name"], "pada": chart["pada"], "rashi": chart["rashi_name"],
+              "paksha": chart["paksha"], "ruling_bird": chart["ruling_bird"],
+              "siddha_force": chart["siddha_force"].split(" ")[0]}
+    for key, want in query.items():
+        want = {want} if isinstance(want, (str, int)) else set(want)
+        if fields[key] not in want:
+            return False
+    return True
+
+
+@pytest.mark.parametrize("query", QUERIES, ids=str)
+def test_intervals_match_compute_chart(query):
+    intervals = find_intervals(START, END, **query)
+    assert intervals
+    for (start, end), following in zip(intervals, intervals[1:] + [(None, None)]):
+        assert START <= start < end <= END
+        assert following[0] is None or end < following[0]
+        assert matches(start, query) and matches(end - MINUTE, query)
+        assert start == START or not matches(start - MINUTE, query)
+        assert end == END or not matches(end, query)
+
+    rng = random.Random(0)
+    starts = [start for start, _ in intervals]
+    for _ in range(SAMPLES):
+        t = START + rng.randrange((END - START) // MINUTE) * MINUTE
+        i = bisect.bisect_right(starts, t) - 1
+        inside = i >= 0 and t < intervals[i][1]
+        assert inside == matches(t, query), t
+
+
+def test_range_starting_inside_an_interval():
+    start, end = find_intervals(START, END, paksha="Shukla")[1]
+    middle = start + (end - start) / 2
+    assert find_intervals(middle, end, paksha="Shukla") == [(middle.replace(second=0, microsecond=0), end)]
+
+
+def test_empty():
+    assert find_intervals(START, END, ruling_bird="Vulture", siddha_force="Peacock-Earth") == []
+    assert find_intervals(END, START, paksha="Shukla") == []
+
+
+def test_unknown_name():
+    with pytest.raises(ValueError, match="unknown nakshatra"):
+        find_intervals(START, END, nakshatra="Pluto")
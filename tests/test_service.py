@@ -0,0 +1,53 @@
+"""Request handling in the chart service, without a server or process pool."""
+import asyncio
+import json
+
+import pytest
+
+from vedic_bird import service
+
+
+def handle(method, target, body=b""):
+    svc = service.ChartService(executor=None)
+
+    # executor=None runs charts in asyncio's default thread pool
+    status, _, payload = asyncio.run(svc.handle(method, target, body))
+    return svc, status, json.loads(payload)
+
+
+@pytest.mark.parametrize("target", [
+    "/chart",
+    "/chart?date=1990-05-17",
+    "/chart?date=1990-13-01&time=08:30",
+    "/chart?date=1990-05-17&time=08:30&tz=Nowhere/Zone",
+    "/chart?date=0001-01-01&time=00:10&tz=Asia/Tokyo",
+    "/chart?utc=0001-01-01T00:00%2B05:00",
+    "/chart?utc=yesterday",
+])
+def test_bad_get(target):
+    svc, status, payload = handle("GET", target)
+    assert status == 400, payload
+    assert "error" in payload
+    assert svc.metrics.counters["errors"] == 1
+
+
+@pytest.mark.parametrize("body", [
+    b'{"utc": 5}',
+    b'{"date": 19900517, "time": "08:30"}',
+    b'{"date": "1990-05-17", "time": "08:30", "tz": ["UTC"]}',
+    b'[1, 2]',
+    b'"1990-05-17T03:00"',
+    b'not json',
+])
+def test_bad_post(body):
+    svc, status, payload = handle("POST", "/chart", body)
+    assert status == 400, payload
+    assert svc.metrics.counters["errors"] == 1
+
+
+def test_good_requests():
+    _, status, get = handle("GET", "/chart?date=1990-05-17&time=08:30&tz=Asia/Kolkata")
+    assert status == 200
+    _, status, post = handle("POST", "/chart", b'{"utc": "1990-05-17T03:00Z"}')
+    assert status == 200
+    assert get["nak_name"] == post["nak_name"] == "Dhanishta"
@@ -0,0 +1,39 @@
+"""The opt-in per-stage timing hook in vedic_bird.chart."""
+import datetime
+
+from vedic_bird import chart
+
+UTC_DT = datetime.datetime(1990, 5, 17, 3, 0, tzinfo=datetime.timezone.utc)
+
+
+def test_hook_sees_every_chart():
+    calls = []
+    previous = chart.set_timing_hook(lambda c, timings: calls.append((c, timings)))
+    try:
+        for precision in chart.PRECISIONS:
+            result = chart.compute_chart(UTC_DT, precision)
+            assert calls[-1][0] is result
+    finally:
+        chart.set_timing_hook(previous)
+    assert len(calls) == len(chart.PRECISIONS)
+    for _, timings in calls:
+        assert set(timings) == {"julian_date", "positions", "chart"}
+        assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_hook_does_not_change_results():
+    plain = chart.compute_chart(UTC_DT)
+    timings = chart.StageTimings()
+    previous = chart.set_timing_hook(timings)
+    try:
+        timed = chart.compute_chart(UTC_DT)
+        chart.compute_chart(UTC_DT)
+    finally:
+        chart.set_timing_hook(previous)
+    assert timed == plain
+    assert timings.count == {"julian_date": 2, "positions": 2, "chart": 2}
+    assert "positions" in timings.report()
+
+
+def test_hook_is_off_by_default():
+    assert chart.set_timing_hook(None) is None
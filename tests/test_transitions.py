@@ -0,0 +1,66 @@
+"""A transition index built over a few days, against compute_chart."""
+import datetime
+
+import pytest
+
+from vedic_bird import chart, transitions
+
+UTC = datetime.timezone.utc
+START = datetime.datetime(2024, 3, 8, tzinfo=UTC)
+END = datetime.datetime(2024, 3, 12, tzinfo=UTC)  # takes in a new moon
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("index") / "transitions.bin")
+    transitions.build(path, START, END)
+    with transitions.TransitionIndex(path) as index:
+        yield index
+
+
+def expected(utc_dt):
+    c = chart.compute_chart(utc_dt)
+    return c["nak_num"], c["pada"], c["rashi_num"], c["paksha"]
+
+
+def test_lookup_matches_compute_chart(index):
+    assert len(index.pada_times) > 10 and len(index.paksha_times) == 2
+    minutes = list(range(index.base_minute, index.end_minute, 97))
+    for times in (index.pada_times, index.paksha_times):
+        for t in times[1:]:
+            minutes.extend((index.base_minute + t - 1, index.base_minute + t))
+    for minute in minutes:
+        utc_dt = transitions._EPOCH + datetime.timedelta(minutes=minute)
+        assert index.lookup(utc_dt) == expected(utc_dt), utc_dt
+
+
+def test_lookup_outside_range(index):
+    with pytest.raises(transitions.OutOfRange):
+        index.lookup(END)
+    with pytest.raises(transitions.OutOfRange):
+        index.lookup(START - datetime.timedelta(minutes=1))
+
+
+def test_chart_state_uses_index_and_falls_back(index, monkeypatch):
+    inside = START + datetime.timedelta(hours=30, minutes=7)
+    outside = END + datetime.timedelta(days=3)
+    monkeypatch.setattr(transitions, "load_if_built", lambda: index)
+    assert chart.chart_state(inside) == expected(inside)
+    assert chart.chart_state(outside) == expected(outside)
+    monkeypatch.setattr(transitions, "load_if_built", lambda: None)
+    assert chart.chart_state(inside) == expected(inside)
+
+
+def test_load_if_built_remembers_failures(tmp_path, monkeypatch):
+    assert transitions.load_if_built(str(tmp_path / "missing.bin")) is None
+
+    stale = tmp_path / "stale.bin"
+    stale.write_bytes(transitions.MAGIC + bytes(transitions.HEADER.size))
+    with pytest.warns(RuntimeWarning, match="not a version"):
+        assert transitions.load_if_built(str(stale)) is None
+
+    def reopened(path):
+        raise AssertionError("failed load retried")
+    monkeypatch.setattr(transitions, "load", reopened)
+    assert transitions.load_if_built(str(stale)) is None
+    assert transitions.load_if_built(str(tmp_path / "missing.bin")) is None
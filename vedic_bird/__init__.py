@@ -0,0 +1,29 @@
+"""Computation core for the Vedic bird app (no Streamlit dependency).
+
+Submodules are imported on first attribute access, so ``import vedic_bird``
+is cheap and does not pull in NumPy unless the batch engine is used.
+"""
+import importlib
+
+_SUBMODULES = {"activities", "astro", "batch", "bulk", "chart", "ephemeris", "meeus", "reports", "search", "service", "tables", "texts", "timezones", "transitions"}
+_EXPORTS = {
+    "compute_chart": "chart",
+    "describe_chart": "chart",
+    "set_timing_hook": "chart",
+    "to_utc": "chart",
+    "available_timezones": "timezones",
+    "activity_periods": "activities",
+    "find_intervals": "search",
+    "write_reports": "reports",
+}
+
+__all__ = sorted(_SUBMODULES | _EXPORTS.keys())
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _EXPORTS:
+        module = importlib.import_module(f"{__name__}.{_EXPORTS[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,98 @@
+"""Daily Pancha Pakshi activity timeline.
+
+Day (sunrise to sunset) and night (sunset to next sunrise) are each split
+into five yamas. In every yama each bird has a main activity and passes
+through all five activities in sub-periods sized by tables.activity_minutes,
+in the order of tables.activity_sequences for the paksha and part of day.
+
+Bird k of the paksha's bird order (shukla_birds / krishna_birds) starts the
+first yama of a Vedic weekday w (Sunday = 0) at position (k + w) of the
+sequence and advances one position per yama. The paksha is the one in force
+at sunrise.
+
+activity_periods() is a generator that keeps only the current day in
+memory, so arbitrarily long ranges stream in constant space.
+"""
+import collections
+import datetime
+import math
+
+from vedic_bird.astro import julian_date, calculate_sun_longitude, calculate_moon_longitude, calculate_sun_rise_set
+from vedic_bird.tables import shukla_birds, krishna_birds, activity_sequences, activity_minutes
+from vedic_bird.timezones import get_zone
+
+ActivityPeriod = collections.namedtuple(
+    "ActivityPeriod", ["date", "part", "yama", "bird", "activity", "sub_activity", "start", "end"])
+
+_UNIX_EPOCH_JD = 2440587.5
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_BIRD_ORDER = {"Shukla": list(shukla_birds), "Krishna": list(krishna_birds)}
+_YAMA_MINUTES = sum(activity_minutes.values())
+
+
+# Sunrise and sunset for a local date at a location, as Julian Dates (UT)
+def sun_rise_set(date, lat, lon):
+    # Start the search from local apparent noon, roughly
+    jd = julian_date(date.year, date.month, date.day, 12) - lon / 360.0
+    rise, set_ = calculate_sun_rise_set(jd, lat, lon)
+    if rise is None or set_ is None:
+        raise ValueError(f"the sun does not rise and set at latitude {lat} on {date}")
+    return rise, set_
+
+
+def paksha_at(jd):
+    d = jd - 2451545.0
+    elong = (calculate_moon_longitude(d) - calculate_sun_longitude(d)) % 360
+    return "Shukla" if elong < 180 else "Krishna"
+
+
+def _daterange(start_date, end_date):
+    for n in range((end_date - start_date).days + 1):
+        yield start_date + datetime.timedelta(days=n)
+
+
+# Stream ActivityPeriod tuples for every date from start_date to end_date
+# (inclusive, local dates) at a location in degrees (east longitude
+# positive). Times are timezone-aware datetimes in `timezone`, at minute
+# resolution. `birds` optionally restricts the output to some birds.
+def activity_periods(start_date, end_date, lat, lon, timezone="UTC", birds=None):
+    zone = get_zone(timezone)
+    next_rise = None
+    for date in _daterange(start_date, end_date):
+        rise, set_ = sun_rise_set(date, lat, lon)
+        if next_rise is not None:
+            rise = next_rise
+        next_rise, _ = sun_rise_set(date + datetime.timedelta(days=1), lat, lon)
+
+        paksha = paksha_at(rise)
+        order = _BIRD_ORDER[paksha]
+        weekday = (date.weekday() + 1) % 7
+
+        # Boundaries are rounded to whole minutes and converted once each;
+        # neighbouring sub-periods and birds share most of them
+        local = {}
+
+        def to_local(jd):
+            minute = math.floor((jd - _UNIX_EPOCH_JD) * 1440 + 0.5)
+            dt = local.get(minute)
+            if dt is None:
+                dt = local[minute] = (_EPOCH + datetime.timedelta(minutes=minute)).astimezone(zone)
+            return dt
+
+        for part, begin, end in (("day", rise, set_), ("night", set_, next_rise)):
+            sequence = activity_sequences[paksha][part]
+            yama = (end - begin) / 5
+            for y in range(5):
+                yama_start = begin + y * yama
+                for k, bird in enumerate(order):
+                    if birds is not None and bird not in birds:
+                        continue
+                    main = (k + weekday + y) % 5
+                    t = yama_start
+                    start = to_local(t)
+                    for i in range(5):
+                        sub_activity = sequence[(main + i) % 5]
+                        t += yama * activity_minutes[sub_activity] / _YAMA_MINUTES
+                        stop = to_local(t)
+                        yield ActivityPeriod(date, part, y + 1, bird, sequence[main], sub_activity, start, stop)
+                        start = stop
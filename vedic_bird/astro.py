@@ -0,0 +1,105 @@
+import math
+
+# Julian Date calculation
+def julian_date(year, month, day, hour=0, minute=0, second=0):
+    if month == 1 or month == 2:
+        yearp = year - 1
+        monthp = month + 12
+    else:
+        yearp = year
+        monthp = month
+    
+    if year < 1582 or (year == 1582 and (month < 10 or (month == 10 and day < 15))):
+        B = 0
+    else:
+        A = math.floor(yearp / 100)
+        B = 2 - A + math.floor(A / 4)
+    
+    C = math.floor(365.25 * (yearp + 4716))
+    D = math.floor(30.6001 * (monthp + 1))
+    jd = B + day + C + D - 1524.5
+    jd += (hour + minute / 60.0 + second / 3600.0) / 24.0
+    return jd
+
+# Calculate Sun's ecliptic longitude
+def calculate_sun_longitude(d):
+    w = 282.9404 + 4.70935e-5 * d
+    e = 0.016709 - 1.151e-9 * d
+    M = (356.0470 + 0.9856002585 * d) % 360
+    Mrad = math.radians(M)
+    E = M + math.degrees(e * math.sin(Mrad) * (1.0 + e * math.cos(Mrad)))
+    Erad = math.radians(E)
+    xv = math.cos(Erad) - e
+    yv = math.sin(Erad) * math.sqrt(1.0 - e*e)
+    v = math.degrees(math.atan2(yv, xv))
+    lonsun = (v + w) % 360
+    return lonsun
+
+# Improved Moon's ecliptic longitude calculation
+def calculate_moon_longitude(d):
+    T = d / 36525.0
+    L0 = 218.31617 + 481267.88088 * T - 4.06 * T**2 / 3600.0
+    M = 134.96292 + 477198.86753 * T + 33.25 * T**2 / 3600.0
+    MSun = 357.52543 + 35999.04944 * T - 0.58 * T**2 / 3600.0
+    F = 93.27283 + 483202.01873 * T - 11.56 * T**2 / 3600.0
+    D = 297.85027 + 445267.11135 * T - 5.15 * T**2 / 3600.0
+
+    Delta = (22640 * math.sin(math.radians(M)) 
+             + 769 * math.sin(math.radians(2 * M)) 
+             - 4586 * math.sin(math.radians(M - 2 * D)) 
+             + 2370 * math.sin(math.radians(2 * D)) 
+             - 668 * math.sin(math.radians(MSun)) 
+             - 412 * math.sin(math.radians(2 * F)) 
+             - 125 * math.sin(math.radians(D)) 
+             - 212 * math.sin(math.radians(2 * M - 2 * D)) 
+             - 206 * math.sin(math.radians(M + MSun - 2 * D)) 
+             + 192 * math.sin(math.radians(M + 2 * D)) 
+             - 165 * math.sin(math.radians(MSun - 2 * D)) 
+             + 148 * math.sin(math.radians(L0 - MSun)) 
+             - 110 * math.sin(math.radians(M + MSun)) 
+             - 55 * math.sin(math.radians(2 * F - 2 * D))) / 3600.0
+
+    lonecl = (L0 + Delta) % 360
+    return lonecl
+
+# Lahiri Ayanamsa approximation
+def calculate_ayanamsa(jd):
+    base_ayan = 23.853  # for J2000
+    rate_per_year = 50.2719 / 3600  # degrees per year
+    years = (jd - 2451545.0) / 365.25
+    ayan = base_ayan + years * rate_per_year
+    return ayan
+
+# Sunrise and sunset (Julian Dates, UT) around jd for a location given in
+# degrees (east longitude positive), from the sun longitude above. Returns
+# None for either event the sun does not reach, as in polar day or night.
+def calculate_sun_rise_set(jd, lat, lon, altitude=-0.833):
+    def hour_angles(jd):
+        d = jd - 2451545.0
+        lam = math.radians(calculate_sun_longitude(d))
+        oblecl = math.radians(23.4393 - 3.563e-7 * d)
+        ra = math.degrees(math.atan2(math.cos(oblecl) * math.sin(lam), math.cos(lam)))
+        decl = math.asin(math.sin(oblecl) * math.sin(lam))
+        # Sidereal time from the sun's mean longitude at this instant, as in
+        # the sun formula: GMST = L + 180 + 360 * (UT as a fraction of a day)
+        L = 356.0470 + 0.9856002585 * d + 282.9404 + 4.70935e-5 * d
+        gmst = L + 180 + 360 * ((jd + 0.5) % 1)
+        ha = (gmst + lon - ra + 180) % 360 - 180
+        cos_lha = ((math.sin(math.radians(altitude)) - math.sin(math.radians(lat)) * math.sin(decl))
+                   / (math.cos(math.radians(lat)) * math.cos(decl)))
+        return ha, cos_lha
+
+    ha, cos_lha = hour_angles(jd)
+    if not -1.0 <= cos_lha <= 1.0:
+        return None, None
+    transit = jd - ha / 360.0
+    events = []
+    for sign in (-1, 1):
+        # One refinement at the first estimate of each event
+        t = transit + sign * math.degrees(math.acos(cos_lha)) / 360.0
+        ha_t, cos_t = hour_angles(t)
+        if not -1.0 <= cos_t <= 1.0:
+            events.append(None)
+            continue
+        events.append(t - ha_t / 360.0 + sign * math.degrees(math.acos(cos_t)) / 360.0)
+    return events[0], events[1]
@@ -0,0 +1,190 @@
+"""Run the "Generate Insights" pipeline over a file of birth records.
+
+    python -m vedic_bird.bulk births.csv -o charts.csv --workers 8
+
+Input is CSV or Parquet (by extension) with columns birth_date
+(YYYY-MM-DD), birth_time (HH:MM[:SS], local), timezone (IANA name) and,
+optionally, place; any other columns are passed through. Output is CSV, or
+JSON Lines when the output name ends in .jsonl, written in input order.
+--precision picks the ephemeris tier (see chart.PRECISIONS), and the
+near_boundary column marks rows that tier cannot place with certainty.
+
+Rows are read in chunks and handed to a process pool with a bounded number
+of chunks in flight, so memory stays flat however large the input is. Each
+worker resolves timezones through timezones.get_zone, which caches one
+ZoneInfo per name per process. Rows that fail (bad date, unknown timezone)
+are written with the error column set instead of stopping the run.
+"""
+import argparse
+import collections
+import concurrent.futures
+import csv
+import datetime
+import io
+import itertools
+import json
+import os
+import sys
+
+from vedic_bird.chart import PRECISIONS, compute_chart, to_utc
+
+RESULT_FIELDS = ["rashi", "nakshatra", "pada", "paksha", "ruling_bird", "siddha_force", "near_boundary", "error"]
+
+
+def _as_date(value):
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(str(value).strip())
+
+
+def _as_time(value):
+    if isinstance(value, datetime.time):
+        return value
+    return datetime.time.fromisoformat(str(value).strip())
+
+
+# (UTC datetime, None) for a row's birth date, time and timezone, or
+# (None, error message) if they cannot be read. ZoneInfoNotFoundError is a
+# KeyError; dates whose UTC time falls outside datetime's range (year 1 in
+# a zone east of UTC) raise OverflowError.
+def row_utc(row):
+    try:
+        return to_utc(_as_date(row["birth_date"]), _as_time(row["birth_time"]), str(row["timezone"]).strip()), None
+    except (KeyError, ValueError, LookupError, OverflowError) as exc:
+        return None, f"{type(exc).__name__}: {exc}"
+
+
+def chart_row(row, precision="fast"):
+    out = dict(row)
+    utc_dt, error = row_utc(row)
+    if error:
+        out.update(dict.fromkeys(RESULT_FIELDS, ""))
+        out["error"] = error
+        return out
+    chart = compute_chart(utc_dt, precision)
+    out.update({
+        "rashi": chart["rashi_name"],
+        "nakshatra": chart["nak_name"],
+        "pada": chart["pada"],
+        "paksha": chart["paksha"],
+        "ruling_bird": chart["ruling_bird"],
+        "siddha_force": chart["siddha_force"],
+        "near_boundary": chart["near_boundary"],
+        "error": "",
+    })
+    return out
+
+
+# Row dicts for one chunk from read_chunks
+def records_from_chunk(fieldnames, rows):
+    if fieldnames is None:
+        return rows.to_pylist()  # a pyarrow RecordBatch
+    # Short rows are padded so every output row lines up with the header
+    return [dict(itertools.zip_longest(fieldnames, row[:len(fieldnames)], fillvalue="")) for row in rows]
+
+
+# Worker entry point: chart one chunk and return it already formatted, so
+# the parent only reads and writes bytes
+def chart_chunk(task):
+    fieldnames, rows, output_format, precision = task
+    results = [chart_row(record, precision) for record in records_from_chunk(fieldnames, rows)]
+
+    buf = io.StringIO()
+    if output_format == "jsonl":
+        for row in results:
+            buf.write(json.dumps(row, ensure_ascii=False, default=str))
+            buf.write("\n")
+    else:
+        writer = csv.writer(buf)
+        writer.writerows(row.values() for row in results)
+    return buf.getvalue()
+
+
+# (fieldnames, chunks) for a CSV file; chunks are lists of raw rows. Exports
+# from spreadsheets and databases often start with a byte order mark, which
+# utf-8-sig drops so it does not end up in the first column name.
+def read_csv(path, chunk_size):
+    f = open(path, newline="", encoding="utf-8-sig")
+    reader = csv.reader(f)
+    fieldnames = next(reader, [])
+
+    def chunks():
+        with f:
+            while True:
+                chunk = list(itertools.islice(reader, chunk_size))
+                if not chunk:
+                    return
+                yield fieldnames, chunk
+
+    return fieldnames, chunks()
+
+
+# Same for Parquet; chunks are RecordBatches, converted in the workers
+def read_parquet(path, chunk_size):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("reading Parquet needs pyarrow (pip install pyarrow)") from None
+    pf = pq.ParquetFile(path)
+    return pf.schema_arrow.names, ((None, batch) for batch in pf.iter_batches(batch_size=chunk_size))
+
+
+def read_chunks(path, chunk_size):
+    if path.endswith(".parquet") or path.endswith(".pq"):
+        return read_parquet(path, chunk_size)
+    return read_csv(path, chunk_size)
+
+
+# Map chunks over the pool, keeping at most max_pending chunks submitted
+# but not yet written, and yield results in input order
+def _ordered_map(executor, func, tasks, max_pending):
+    pending = collections.deque()
+    for task in tasks:
+        pending.append(executor.submit(func, task))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def process(tasks, workers=None, max_pending=None, func=chart_chunk):
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from map(func, tasks)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _ordered_map(executor, func, tasks, max_pending or 2 * workers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m vedic_bird.bulk", description="Compute charts for a file of birth records.")
+    parser.add_argument("input", help="CSV or Parquet file")
+    parser.add_argument("-o", "--output", default="-", help="output file (.csv or .jsonl), default stdout as CSV")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="rows per task")
+    parser.add_argument("--precision", choices=PRECISIONS, default="fast",
+                        help="ephemeris tier; near_boundary marks rows within its error of a pada or paksha change")
+    args = parser.parse_args(argv)
+
+    output_format = "jsonl" if args.output.endswith(".jsonl") else "csv"
+    fieldnames, chunks = read_chunks(args.input, args.chunk_size)
+    tasks = ((names, rows, output_format, args.precision) for names, rows in chunks)
+    if args.output == "-":
+        out = sys.stdout
+    else:
+        out = open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        if output_format == "csv":
+            csv.writer(out).writerow(fieldnames + [f for f in RESULT_FIELDS if f not in fieldnames])
+        for text in process(tasks, args.workers):
+            out.write(text)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
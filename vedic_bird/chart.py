@@ -0,0 +1,236 @@
+"""The "Generate Insights" pipeline from app.py, without any UI."""
+import collections
+import datetime
+import functools
+import math
+import random
+import time
+
+from vedic_bird.astro import julian_date, calculate_sun_longitude, calculate_moon_longitude, calculate_ayanamsa
+from vedic_bird.tables import (nakshatras, rashis, get_siddha_force, rashi_elements, PAKSHAS, BIRDS, BIRD_SANSKRIT,
+                               SIDDHA_FORCES, ELEMENTS, STRING_TYPES, chart_codes)
+from vedic_bird.timezones import UTC, get_zone
+
+# "fast" is the original series in vedic_bird.astro, "precise" the full
+# series in vedic_bird.meeus and "chebyshev" the same fitted into the shipped
+# vedic_bird.ephemeris file (as accurate as "precise", cheaper than "fast";
+# dates outside the file fall back to "precise")
+PRECISIONS = ("fast", "precise", "chebyshev")
+
+# Worst error in degrees over 1900-2100 of the sidereal moon longitude and of
+# the sun-moon elongation per tier, measured against the Swiss Ephemeris by
+# benchmarks/bench_precision.py and rounded up. Charts whose moon is closer
+# than that to a pada boundary (nakshatra and rashi boundaries are pada
+# boundaries too), or whose elongation is that close to 0 or 180, may come
+# out differently with an exact ephemeris and are flagged near_boundary.
+ERROR_BOUNDS = {
+    "fast": (0.2, 1.8),
+    "precise": (0.03, 0.03),
+    "chebyshev": (0.03, 0.03),
+}
+
+
+
+# (ruling bird, Sanskrit name, Siddha force, element, string type) for each
+# nakshatra and paksha, decoded once from tables.CHART_TABLE and indexed
+# like it; names missing from the mappings come out as before
+def _chart_names():
+    names = []
+    for nak_num, nak_name in enumerate(nakshatras):
+        for p, paksha in enumerate(PAKSHAS):
+            bird, force, element, string_type = chart_codes(nak_num, p)
+            names.append((
+                BIRDS[bird] if bird >= 0 else None,
+                BIRD_SANSKRIT[bird] if bird >= 0 else "Unknown",
+                SIDDHA_FORCES[force] if force >= 0 else get_siddha_force(nak_name, paksha),
+                ELEMENTS[element] if element >= 0 else "Unknown",
+                STRING_TYPES[string_type] if string_type >= 0 else "Unknown",
+            ))
+    return names
+
+
+_CHART_NAMES = _chart_names()
+
+
+# Combine a local birth date and time in an IANA timezone into a UTC datetime
+def to_utc(birth_date, birth_time, timezone):
+    local_dt = datetime.datetime.combine(birth_date, birth_time)
+    local_dt = local_dt.replace(tzinfo=get_zone(timezone))
+    return local_dt.astimezone(UTC)
+
+
+def _fast_positions(jd):
+    d = jd - 2451545.0
+    return calculate_sun_longitude(d), calculate_moon_longitude(d), calculate_ayanamsa(jd)
+
+
+def _precise_positions(jd):
+    from vedic_bird import meeus
+    jde = meeus.to_jde(jd)
+    return meeus.sun_longitude(jde), meeus.moon_longitude(jde), meeus.lahiri_ayanamsa(jde)
+
+
+# Position function for a tier, resolved once so the per-chart cost is only
+# the evaluation itself. The ephemeris file and vedic_bird.meeus are loaded
+# on first use of their tier.
+@functools.cache
+def _positions_for(precision):
+    if precision == "fast":
+        return _fast_positions
+    if precision == "precise":
+        return _precise_positions
+    if precision == "chebyshev":
+        from vedic_bird import ephemeris
+        eph = ephemeris.load()
+        start, end, evaluate = eph.start_jd, eph.end_jd, eph.positions
+
+        def chebyshev_positions(jd):
+            if start <= jd < end:
+                return evaluate(jd)
+            return _precise_positions(jd)  # same series, outside the fitted range
+        return chebyshev_positions
+    raise ValueError(f"unknown precision {precision!r}; expected one of {', '.join(PRECISIONS)}")
+
+
+# (sun longitude, moon longitude, ayanamsa) for a Julian Date in UT
+def positions(jd, precision="fast"):
+    return _positions_for(precision)(jd)
+
+
+# Opt-in per-stage timing: when set, the hook is called after every
+# compute_chart as hook(chart, timings), timings mapping each stage
+# ("julian_date", "positions", "chart") to seconds
+_timing_hook = None
+
+
+# Install a timing hook (None removes it) and return the previous one
+def set_timing_hook(hook):
+    global _timing_hook
+    previous, _timing_hook = _timing_hook, hook
+    return previous
+
+
+# Timing hook that accumulates count, total and worst time per stage
+class StageTimings:
+    def __init__(self):
+        self.count = collections.Counter()
+        self.total = collections.Counter()
+        self.worst = collections.Counter()
+
+    def __call__(self, chart, timings):
+        for stage, seconds in timings.items():
+            self.count[stage] += 1
+            self.total[stage] += seconds
+            self.worst[stage] = max(self.worst[stage], seconds)
+
+    def report(self):
+        lines = []
+        for stage, n in self.count.items():
+            lines.append(f"{stage:>12}: {n:8d} calls, mean {self.total[stage] / n * 1e6:8.2f} us, "
+                         f"max {self.worst[stage] * 1e6:8.2f} us")
+        return "\n".join(lines)
+
+
+def _timed_chart(utc_dt, precision, hook):
+    clock = time.perf_counter
+    t0 = clock()
+    jd = julian_date(utc_dt.year, utc_dt.month, utc_dt.day, utc_dt.hour, utc_dt.minute)
+    t1 = clock()
+    pos = positions(jd, precision)
+    t2 = clock()
+    chart = _chart_from_positions(jd, pos, precision)
+    t3 = clock()
+    hook(chart, {"julian_date": t1 - t0, "positions": t2 - t1, "chart": t3 - t2})
+    return chart
+
+
+# Compute the chart for a UTC datetime (minute resolution, as in the app)
+def compute_chart(utc_dt, precision="fast"):
+    hook = _timing_hook
+    if hook is not None:
+        return _timed_chart(utc_dt, precision, hook)
+    jd = julian_date(utc_dt.year, utc_dt.month, utc_dt.day, utc_dt.hour, utc_dt.minute)
+    return _chart_from_positions(jd, positions(jd, precision), precision)
+
+
+# (nak_num, pada, rashi_num, paksha) for a UTC datetime, as compute_chart
+# gives them in the fast tier: looked up in the transition index when it has
+# been built and covers the date, else computed. For callers that need only
+# the chart state; the index has no longitudes or boundary margins.
+def chart_state(utc_dt):
+    from vedic_bird import transitions
+
+    index = transitions.load_if_built()
+    if index is not None:
+        try:
+            return index.lookup(utc_dt)
+        except transitions.OutOfRange:
+            pass
+    chart = compute_chart(utc_dt)
+    return chart["nak_num"], chart["pada"], chart["rashi_num"], chart["paksha"]
+
+
+def _chart_from_positions(jd, pos, precision):
+    sun_long, moon_long, ayan = pos
+    sid_moon = (moon_long - ayan) % 360
+
+    nak_num = math.floor(sid_moon / (360 / 27))
+    nak_rem = sid_moon % (360 / 27)
+    pada = math.floor(nak_rem / (360 / 108)) + 1
+
+    rashi_num = math.floor(sid_moon / 30)
+
+    elong = (moon_long - sun_long) % 360
+    paksha_idx = 0 if elong < 180 else 1
+    ruling_bird, sanskrit_name, siddha_force, element, string_type = _CHART_NAMES[nak_num * 2 + paksha_idx]
+
+    # Distance in degrees to the nearest pada and paksha boundary
+    pada_rem = sid_moon % (360 / 108)
+    pada_margin = min(pada_rem, 360 / 108 - pada_rem)
+    paksha_margin = min(elong % 180, 180 - elong % 180)
+    moon_bound, elong_bound = ERROR_BOUNDS[precision]
+
+    return {
+        "jd": jd,
+        "sun_long": sun_long,
+        "moon_long": moon_long,
+        "ayanamsa": ayan,
+        "sid_moon": sid_moon,
+        "nak_num": nak_num,
+        "nak_name": nakshatras[nak_num],
+        "pada": pada,
+        "rashi_num": rashi_num,
+        "rashi_name": rashis[rashi_num],
+        "paksha": PAKSHAS[paksha_idx],
+        "ruling_bird": ruling_bird,
+        "element": element,
+        "string_type": string_type,
+        "sanskrit_name": sanskrit_name,
+        "siddha_force": siddha_force,
+        "precision": precision,
+        "pada_margin": pada_margin,
+        "paksha_margin": paksha_margin,
+        "near_boundary": pada_margin < moon_bound or paksha_margin < elong_bound,
+    }
+
+
+# Text for a computed chart. The description tables are imported here, on
+# first use, rather than with the module. The closing phrase is drawn with
+# rng unless given as fun_phrase (see reports.pick_phrase for a seeded one).
+def describe_chart(chart, rng=random, fun_phrase=None):
+    from vedic_bird import texts
+
+    element = chart["element"]
+    r_trait = texts.rashi_traits.get(chart["rashi_name"], "mysterious soul 🌌")
+    n_trait = texts.nak_traits.get(chart["nak_name"], "cosmic wanderer ⭐")
+    if fun_phrase is None:
+        fun_phrase = rng.choice(texts.fun_phrases.get(element, ["embody the universe's mysteries! 🌌🔮✨"]))
+
+    dynamic_desc = f"You are a {r_trait} infused with {n_trait} in Pada {chart['pada']} precision ⏳, guided by {chart['ruling_bird']} ({chart['sanskrit_name']}) of {element} vibes like {chart['string_type']} strings vibrating through reality! {fun_phrase}"
+
+    return {
+        "rashi_element": rashi_elements.get(chart["rashi_name"], "Unknown"),
+        "dynamic_desc": dynamic_desc,
+        "bird_desc": texts.bird_descriptions.get(chart["ruling_bird"], "This bird embodies cosmic mysteries! 🌌"),
+        "divination_desc": texts.descriptions.get(chart["siddha_force"], "Mysterious forces guide your path! 🌌"),
+    }
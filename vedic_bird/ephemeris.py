@@ -0,0 +1,192 @@
+"""Chebyshev ephemeris for the "chebyshev" tier.
+
+The full series in vedic_bird.meeus cost a hundred-odd trig calls per chart.
+This module fits them once, offline, with piecewise Chebyshev polynomials in
+UT (delta T is folded into the fit), so a lookup is a segment index and a
+handful of multiply-adds. The fit is within 0.05" of the series it was
+built from, far below the series' own error, which benchmarks/bench_precision.py
+measures at under 80" against the Swiss Ephemeris.
+
+    python -m vedic_bird.ephemeris build     # writes DEFAULT_PATH
+    python -m vedic_bird.ephemeris verify    # checks it against vedic_bird.meeus
+
+The file is shipped in vedic_bird/data and covers the same range as the
+transition index, 1899-12-31 to 2101-01-02 UTC.
+
+File layout (little-endian): a 16-byte header (magic, version, first Julian
+Date), then for the moon and the sun a 12-byte record (segment length in
+days, segment count, coefficients per segment), then the moon's and the
+sun's float64 coefficients, segment by segment. Values are tropical
+longitudes in degrees, continuous within a segment; callers reduce them
+mod 360.
+"""
+import argparse
+import functools
+import math
+import mmap
+import os
+import random
+import struct
+import sys
+
+from vedic_bird import meeus
+
+MAGIC = b"VBEP"
+VERSION = 1
+HEADER = struct.Struct("<4sId")
+BODY = struct.Struct("<III")
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "ephemeris.bin")
+
+START_JD = 2415019.5  # 1899-12-31 00:00 UTC
+END_JD = 2488435.5    # 2101-01-02 00:00 UTC
+
+# (segment days, coefficients) per body: the moon's fastest terms need short
+# segments, the sun gets by with half-month ones. Sized for a fit error
+# under 0.05" with as few coefficients per lookup as possible.
+MOON_FIT = (6, 8)
+SUN_FIT = (16, 6)
+
+
+class Ephemeris:
+    def __init__(self, path=DEFAULT_PATH):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.start_jd = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {VERSION} ephemeris")
+
+        # One struct per body unpacks a whole segment; "<" keeps the file
+        # little-endian whatever the host
+        offset = HEADER.size + 2 * BODY.size
+        bodies = []
+        for i in range(2):
+            span, count, ncoeff = BODY.unpack_from(self._mmap, HEADER.size + i * BODY.size)
+            segment = struct.Struct(f"<{ncoeff}d")
+            bodies.append((span, count, offset, segment))
+            offset += count * segment.size
+        self.moon, self.sun = bodies
+        self.end_jd = self.start_jd + min(span * count for span, count, _, _ in bodies)
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Clenshaw recurrence on one segment
+    def _evaluate(self, body, jd):
+        span, count, offset, segment = body
+        t = (jd - self.start_jd) / span
+        seg = math.floor(t)
+        if not 0 <= seg < count:
+            raise ValueError(f"Julian Date {jd} is outside the ephemeris range {self.start_jd} to {self.end_jd}")
+        x = 2 * (t - seg) - 1
+        x2 = x + x
+        coeffs = segment.unpack_from(self._mmap, offset + seg * segment.size)
+        b1 = b2 = 0.0
+        for c in coeffs[:0:-1]:
+            b1, b2 = c + x2 * b1 - b2, b1
+        return (coeffs[0] + x * b1 - b2) % 360
+
+    def moon_longitude(self, jd):
+        return self._evaluate(self.moon, jd)
+
+    def sun_longitude(self, jd):
+        return self._evaluate(self.sun, jd)
+
+    # (sun, moon, ayanamsa) for a Julian Date in UT. The ayanamsa moves
+    # 0.014" a day, so evaluating it at UT rather than TT is good to 1e-4".
+    def positions(self, jd):
+        return self._evaluate(self.sun, jd), self._evaluate(self.moon, jd), meeus.lahiri_ayanamsa(jd)
+
+
+@functools.cache
+def load(path=DEFAULT_PATH):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{path} not found; run 'python -m vedic_bird.ephemeris build' first")
+    return Ephemeris(path)
+
+
+def moon_at(jd):
+    return meeus.moon_longitude(meeus.to_jde(jd))
+
+
+def sun_at(jd):
+    return meeus.sun_longitude(meeus.to_jde(jd))
+
+
+# Chebyshev coefficients of func over consecutive segments, fitted by
+# interpolation at the Chebyshev nodes
+def _fit(func, span, ncoeff):
+    import numpy as np
+
+    count = math.ceil((END_JD - START_JD) / span)
+    k = np.arange(ncoeff) + 0.5
+    nodes = np.cos(np.pi * k / ncoeff)
+    basis = np.cos(np.pi * np.outer(np.arange(ncoeff), k) / ncoeff) * (2 / ncoeff)
+    basis[0] /= 2
+
+    values = np.array([[func(START_JD + s * span + (x + 1) * span / 2) for x in nodes] for s in range(count)])
+    # The nodes are a few degrees apart, so unwrapping between neighbours
+    # makes each segment's longitudes continuous
+    values = np.degrees(np.unwrap(np.radians(values), axis=1))
+    return count, values @ basis.T
+
+
+def build(path=DEFAULT_PATH):
+    fits = [(span, ncoeff) + _fit(func, span, ncoeff) for func, (span, ncoeff) in ((moon_at, MOON_FIT), (sun_at, SUN_FIT))]
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, START_JD))
+        for span, ncoeff, count, _ in fits:
+            f.write(BODY.pack(span, count, ncoeff))
+        for _, _, _, coeffs in fits:
+            f.write(coeffs.astype("<f8").tobytes())
+    os.replace(tmp, path)
+    load.cache_clear()
+    return os.path.getsize(path)
+
+
+# Largest difference (arcseconds) between the file and the series it was
+# fitted to, at random instants
+def verify(path=DEFAULT_PATH, samples=20000, seed=0):
+    rng = random.Random(seed)
+    worst = {"moon": 0.0, "sun": 0.0}
+    with Ephemeris(path) as eph:
+        for _ in range(samples):
+            jd = rng.uniform(eph.start_jd, eph.end_jd)
+            for name, fitted, series in (("moon", eph.moon_longitude, moon_at), ("sun", eph.sun_longitude, sun_at)):
+                error = abs((fitted(jd) - series(jd) + 180) % 360 - 180) * 3600
+                worst[name] = max(worst[name], error)
+    return worst
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m vedic_bird.ephemeris", description="Build or verify the Chebyshev ephemeris.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="fit the full series and write the file")
+    p_build.add_argument("--path", default=DEFAULT_PATH)
+    p_verify = sub.add_parser("verify", help="check the file against the full series")
+    p_verify.add_argument("--path", default=DEFAULT_PATH)
+    p_verify.add_argument("--samples", type=int, default=20000)
+    p_verify.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        size = build(args.path)
+        print(f"wrote {args.path}: {size} bytes")
+        return 0
+
+    worst = verify(args.path, args.samples, args.seed)
+    print(f"checked {args.samples} instants, largest error moon {worst['moon']:.5f}\" sun {worst['sun']:.5f}\"")
+    return 0 if max(worst.values()) < 0.05 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
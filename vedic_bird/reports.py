@@ -0,0 +1,265 @@
+"""Precompiled report templates for bulk output.
+
+    python -m vedic_bird.reports births.csv -o reports.html --seed 7
+
+Apart from per-record fields such as the birth time and place, a report is
+fixed by the chart's nakshatra, pada and paksha and by its closing phrase:
+216 chart states and three phrases per element. Templates are therefore
+split once, when compiled, into runs that only depend on the chart and the
+per-record fields between them. Each run is rendered the first time its
+chart state and phrase come up and kept, interned, in the template's cache;
+after that a report costs a dictionary lookup and a join.
+
+Phrases are chosen by pick_phrase from a CRC of the chart's Julian Date
+started from the seed, so a seed reproduces its output exactly and
+identical charts get identical reports.
+
+FORMATS holds markdown, html and jsonl. A format is a header, a record
+template, a footer and an escape function applied to every field value;
+add an entry to FORMATS to plug in another.
+"""
+import argparse
+import collections
+import functools
+import html
+import json
+import json.encoder
+import string
+import struct
+import sys
+import zlib
+
+from vedic_bird import texts
+from vedic_bird.chart import PRECISIONS, compute_chart, describe_chart
+
+_encode_string = json.encoder.encode_basestring
+_pack_double = struct.Struct("<d").pack
+ReportFormat = collections.namedtuple("ReportFormat", ["header", "record", "footer", "escape"])
+
+# Fields that only depend on the chart state and phrase; any other field a
+# template names is looked up in the record each time (empty if missing)
+STATIC_FIELDS = frozenset([
+    "nak_num", "nak_name", "pada", "rashi_num", "rashi_name", "paksha", "ruling_bird", "element",
+    "string_type", "sanskrit_name", "siddha_force", "rashi_element", "dynamic_desc", "bird_desc",
+    "divination_desc", "fun_phrase",
+])
+
+MARKDOWN_RECORD = """\
+## 🌟 Your Combined Vedic & Siddha Insights for {place} ({utc}) 🌟
+
+- **Rashi:** {rashi_name} (Element: {rashi_element})
+- **Nakshatra:** {nak_name}, Pada {pada}
+- **Paksha:** {paksha}
+- **Pancha Pakshi Ruling Bird (Panchabhuta):** {ruling_bird} ({sanskrit_name}) ({element})
+- **Linked String Type:** {string_type}
+- **Siddha Pakshi Force:** {siddha_force}
+
+**Dynamic Fun Description:** {dynamic_desc}
+
+**Bird Meaning in Context:** {bird_desc}
+
+**Siddha Pakshi Prasna Divination:** {divination_desc}
+
+"""
+
+HTML_HEADER = """\
+<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>Divination by Mahaan</title></head>
+<body>
+"""
+
+HTML_RECORD = """\
+<section>
+<h2>🌟 Your Combined Vedic &amp; Siddha Insights for {place} ({utc}) 🌟</h2>
+<ul>
+<li><strong>Rashi:</strong> {rashi_name} (Element: {rashi_element})</li>
+<li><strong>Nakshatra:</strong> {nak_name}, Pada {pada}</li>
+<li><strong>Paksha:</strong> {paksha}</li>
+<li><strong>Pancha Pakshi Ruling Bird (Panchabhuta):</strong> {ruling_bird} ({sanskrit_name}) ({element})</li>
+<li><strong>Linked String Type:</strong> {string_type}</li>
+<li><strong>Siddha Pakshi Force:</strong> {siddha_force}</li>
+</ul>
+<p><strong>Dynamic Fun Description:</strong> {dynamic_desc}</p>
+<p><strong>Bird Meaning in Context:</strong> {bird_desc}</p>
+<p><strong>Siddha Pakshi Prasna Divination:</strong> {divination_desc}</p>
+</section>
+"""
+
+JSONL_RECORD = (
+    '{{"utc": {utc}, "place": {place}, "rashi": {rashi_name}, "rashi_element": {rashi_element}, '
+    '"nakshatra": {nak_name}, "pada": {pada}, "paksha": {paksha}, "ruling_bird": {ruling_bird}, '
+    '"sanskrit_name": {sanskrit_name}, "element": {element}, "string_type": {string_type}, '
+    '"siddha_force": {siddha_force}, "dynamic_desc": {dynamic_desc}, "bird_desc": {bird_desc}, '
+    '"divination_desc": {divination_desc}}}\n'
+)
+
+
+def _html_escape(value):
+    return html.escape(str(value))
+
+
+# encode_basestring is json's C string encoder, as used by dumps with
+# ensure_ascii=False, without the dispatch on type
+def _json_escape(value):
+    if isinstance(value, str):
+        return _encode_string(value)
+    return json.dumps(value, ensure_ascii=False)
+
+
+FORMATS = {
+    "markdown": ReportFormat("", MARKDOWN_RECORD, "", str),
+    "html": ReportFormat(HTML_HEADER, HTML_RECORD, "</body>\n</html>\n", _html_escape),
+    "jsonl": ReportFormat("", JSONL_RECORD, "", _json_escape),
+}
+EXTENSIONS = {".md": "markdown", ".html": "html", ".htm": "html", ".jsonl": "jsonl"}
+
+
+# Closing phrase for a chart: the CRC-32 of the chart's Julian Date as a
+# double, started from the seed, picks one of the element's phrases. None
+# when the element has no phrases, leaving describe_chart's default.
+def pick_phrase(chart, seed=0):
+    phrases = texts.fun_phrases.get(chart["element"])
+    if not phrases:
+        return None
+    return phrases[zlib.crc32(_pack_double(chart["jd"]), seed & 0xFFFFFFFF) % len(phrases)]
+
+
+class Template:
+    def __init__(self, source, escape=str):
+        self.escape = escape
+        # Static runs as format strings over STATIC_FIELDS, with one
+        # per-record field between each pair
+        self.runs = []
+        self.fields = []
+        run = []
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            run.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field is None:
+                continue
+            if spec or conversion:
+                raise ValueError(f"format specs and conversions are not supported: {{{field}}}")
+            if field in STATIC_FIELDS:
+                run.append("{" + field + "}")
+            else:
+                self.runs.append("".join(run))
+                self.fields.append(field)
+                run = []
+        self.runs.append("".join(run))
+        self.cache = {}
+
+    def _blocks(self, key, chart, phrase):
+        values = dict(chart)
+        values.update(describe_chart(chart, fun_phrase=phrase))
+        values["fun_phrase"] = phrase or ""
+        escaped = {name: self.escape(values[name]) for name in STATIC_FIELDS if name in values}
+        blocks = self.cache[key] = tuple(sys.intern(run.format_map(escaped)) for run in self.runs)
+        return blocks
+
+    # Report text for a record: a compute_chart dict plus any per-record
+    # fields the template uses
+    def render(self, record, seed=0):
+        phrase = pick_phrase(record, seed)
+        key = (record["nak_num"], record["pada"], record["paksha"], phrase)
+        blocks = self.cache.get(key)
+        if blocks is None:
+            blocks = self._blocks(key, record, phrase)
+        if not self.fields:
+            return blocks[0]
+        escape = self.escape
+        parts = [blocks[0]]
+        for field, block in zip(self.fields, blocks[1:]):
+            parts.append(escape(record.get(field, "")))
+            parts.append(block)
+        return "".join(parts)
+
+
+@functools.cache
+def template(fmt):
+    spec = FORMATS[fmt]
+    return Template(spec.record, spec.escape)
+
+
+# Report text for each record, preceded by the format's header and followed
+# by its footer; a generator, so output can be written as it is produced
+def iter_reports(records, fmt="markdown", seed=0):
+    spec = FORMATS[fmt]
+    render = template(fmt).render
+    if spec.header:
+        yield spec.header
+    for record in records:
+        yield render(record, seed)
+    if spec.footer:
+        yield spec.footer
+
+
+# Write reports to a text file object, batch_size reports per write call
+def write_reports(records, out, fmt="markdown", seed=0, batch_size=1024):
+    batch = []
+    for text in iter_reports(records, fmt, seed):
+        batch.append(text)
+        if len(batch) >= batch_size:
+            out.write("".join(batch))
+            batch.clear()
+    out.write("".join(batch))
+
+
+# Worker entry point for the CLI, in the manner of bulk.chart_chunk: chart
+# and render one chunk of input rows. Rows that fail are counted, not
+# rendered.
+def report_chunk(task):
+    from vedic_bird.bulk import records_from_chunk, row_utc
+
+    fieldnames, rows, fmt, seed, precision = task
+    render = template(fmt).render
+    parts = []
+    errors = 0
+    for row in records_from_chunk(fieldnames, rows):
+        utc_dt, error = row_utc(row)
+        if error:
+            errors += 1
+            continue
+        record = compute_chart(utc_dt, precision)
+        record["utc"] = utc_dt.strftime("%Y-%m-%d %H:%M UTC")
+        record["place"] = row.get("place") or "Unknown Place"
+        parts.append(render(record, seed))
+    return "".join(parts), errors
+
+
+def main(argv=None):
+    from vedic_bird import bulk
+
+    parser = argparse.ArgumentParser(prog="python -m vedic_bird.reports", description="Render reports for a file of birth records.")
+    parser.add_argument("input", help="CSV or Parquet file, as for vedic_bird.bulk")
+    parser.add_argument("-o", "--output", default="-", help="output file, default stdout")
+    parser.add_argument("--format", choices=sorted(FORMATS), help="default: from the output extension, else markdown")
+    parser.add_argument("--seed", type=int, default=0, help="phrase selection seed")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="rows per task")
+    parser.add_argument("--precision", choices=PRECISIONS, default="fast")
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        fmt = next((name for ext, name in EXTENSIONS.items() if args.output.endswith(ext)), "markdown")
+    spec = FORMATS[fmt]
+    _, chunks = bulk.read_chunks(args.input, args.chunk_size)
+    tasks = ((names, rows, fmt, args.seed, args.precision) for names, rows in chunks)
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    errors = 0
+    try:
+        out.write(spec.header)
+        for text, failed in bulk.process(tasks, args.workers, func=report_chunk):
+            out.write(text)
+            errors += failed
+        out.write(spec.footer)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if errors:
+        print(f"skipped {errors} rows with a bad date, time or timezone", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
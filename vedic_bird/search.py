@@ -0,0 +1,222 @@
+"""Find the time intervals in which a chart meets given constraints.
+
+    python -m vedic_bird.search 2024-01-01 2025-01-01 --nakshatra Rohini --pada 2 --paksha Krishna
+
+A chart's nakshatra, pada and rashi follow from the moon's sidereal
+longitude and its paksha from the sun-moon elongation, and both increase
+monotonically. Constraints on any chart fields therefore reduce to a set of
+allowed (pada, paksha) states, and the answer only changes where the moon
+crosses a pada boundary between an allowed and a disallowed state, or where
+the elongation crosses 0 or 180 degrees. Those crossings are located
+directly by secant iteration from the mean motion, vectorized over all
+months of the range at once; nothing is scanned, and a 200-year query takes
+a few tens of milliseconds.
+
+Times match compute_chart (the "fast" tier) at minute resolution: an
+interval starts at the first minute whose chart meets the constraints and
+ends at the first minute that does not.
+"""
+import argparse
+import datetime
+import sys
+
+import numpy as np
+
+from vedic_bird import batch
+from vedic_bird.chart import chart_state
+from vedic_bird.tables import nakshatras, rashis, BIRDS, SIDDHA_FORCES, chart_codes
+
+# Mean rates in degrees per day of the sidereal moon (sidereal month) and of
+# the elongation (synodic month)
+SIDEREAL_RATE = 360 / 27.321662
+SYNODIC_RATE = 360 / 29.530589
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _as_set(value):
+    if value is None:
+        return None
+    if isinstance(value, (str, int)):
+        return {value}
+    return set(value)
+
+
+def _check(name, values, known):
+    if values is not None and not values <= set(known):
+        unknown = ", ".join(map(str, sorted(values - set(known), key=str)))
+        raise ValueError(f"unknown {name} {unknown}")
+
+
+# Forces may be given in full ("Peacock-Earth 🦚🌍") or by name ("Peacock-Earth")
+def _force_names(force):
+    return {force, force.split(" ")[0]}
+
+
+# Boolean table allowed[pada state, paksha index], a pada state being
+# nak_num * 4 + pada - 1 as in vedic_bird.transitions
+def allowed_states(nakshatra=None, pada=None, rashi=None, paksha=None, ruling_bird=None, siddha_force=None):
+    nakshatra, pada, rashi = _as_set(nakshatra), _as_set(pada), _as_set(rashi)
+    paksha, ruling_bird, siddha_force = _as_set(paksha), _as_set(ruling_bird), _as_set(siddha_force)
+    _check("nakshatra", nakshatra, nakshatras)
+    _check("pada", pada, (1, 2, 3, 4))
+    _check("rashi", rashi, rashis)
+    _check("paksha", paksha, batch.PAKSHAS)
+    _check("ruling bird", ruling_bird, BIRDS)
+    _check("siddha force", siddha_force, set().union(*map(_force_names, SIDDHA_FORCES)))
+
+    allowed = np.zeros((108, 2), dtype=bool)
+    for state in range(108):
+        nak_name = nakshatras[state // 4]
+        for p, paksha_name in enumerate(batch.PAKSHAS):
+            # Bird and force codes as compute_chart uses them
+            bird, force = chart_codes(state // 4, p)[:2]
+            allowed[state, p] = (
+                (nakshatra is None or nak_name in nakshatra)
+                and (pada is None or state % 4 + 1 in pada)
+                and (rashi is None or rashis[state // 9] in rashi)
+                and (paksha is None or paksha_name in paksha)
+                and (ruling_bird is None or bird >= 0 and BIRDS[bird] in ruling_bird)
+                and (siddha_force is None or force >= 0 and not siddha_force.isdisjoint(_force_names(SIDDHA_FORCES[force])))
+            )
+    return allowed
+
+
+def _sid_moon(jd):
+    d = jd - batch.J2000
+    return batch.wrap(batch.calculate_moon_longitude(d) - batch.calculate_ayanamsa(jd))
+
+
+def _elongation(jd):
+    d = jd - batch.J2000
+    return batch.wrap(batch.calculate_moon_longitude(d) - batch.calculate_sun_longitude(d))
+
+
+def _minute_jd(minutes):
+    return batch.datetime64_to_jd(minutes.astype("datetime64[m]"))
+
+
+# Minutes (since the Unix epoch) in (m0, m1) at which func, increasing at
+# about `rate` degrees a day, first shows it has passed one of `targets`, and
+# which target each was, in time order. Every crossing gets a guess from the
+# mean motion, one per period across the range (plus one either side), and
+# the secant method refines all of them together, one evaluation per step.
+def _crossings(func, rate, targets, m0, m1):
+    targets = np.asarray(targets, dtype=np.float64)
+    if len(targets) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    jd0 = _minute_jd(np.array([m0]))[0]
+    period = 360 / rate
+    first = jd0 - period + (targets - func(np.array([jd0]))[0]) % 360 / rate
+    k = np.arange(int((m1 - m0) / 1440 / period) + 3)
+    t = (first[:, None] + k * period).ravel()
+    which = np.repeat(np.arange(len(targets)), len(k))
+    target = targets[which]
+
+    # The first step uses the mean rate as the slope
+    error = batch.wrap(func(t) - target + 180) - 180
+    t_prev, error_prev = t, error
+    t = t - error / rate
+    for _ in range(20):
+        error = batch.wrap(func(t) - target + 180) - 180
+        moved = t - t_prev
+        step = np.divide(error * moved, error - error_prev, out=np.zeros_like(t), where=error != error_prev)
+        t_prev, error_prev = t, error
+        t = t - step
+        if np.abs(step).max() < 1e-8:
+            break
+
+    # Round up to the minute. A crossing within rounding of a minute
+    # boundary is settled by evaluating the minutes either side.
+    frac = (t - batch.UNIX_EPOCH_JD) * 1440
+    minutes = np.ceil(frac).astype(np.int64)
+    close = np.flatnonzero(np.abs(frac - np.rint(frac)) < 1e-4)
+    if len(close):
+        m = minutes[close]
+        m += batch.wrap(func(_minute_jd(m)) - target[close]) >= 180
+        m -= batch.wrap(func(_minute_jd(m - 1)) - target[close]) < 180
+        minutes[close] = m
+
+    keep = (minutes > m0) & (minutes < m1)
+    minutes, which = minutes[keep], which[keep]
+    order = np.argsort(minutes, kind="stable")
+    return minutes[order], which[order]
+
+
+# Carry the last non-negative value forward
+def _fill_forward(values):
+    idx = np.where(values >= 0, np.arange(len(values)), 0)
+    return values[np.maximum.accumulate(idx)]
+
+
+def _to_minute(value):
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime.combine(value, datetime.time())
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return (value - _EPOCH) // datetime.timedelta(minutes=1)
+
+
+# All intervals from start to end (datetimes or dates; naive means UTC) in
+# which the chart meets every given constraint, as a list of (start, end)
+# UTC datetimes with end exclusive, clipped to the range. Each constraint is
+# a value or a collection of allowed values.
+def find_intervals(start, end, nakshatra=None, pada=None, rashi=None, paksha=None, ruling_bird=None, siddha_force=None):
+    allowed = allowed_states(nakshatra, pada, rashi, paksha, ruling_bird, siddha_force)
+    m0, m1 = _to_minute(start), _to_minute(end)
+    if m1 <= m0 or not allowed.any():
+        return []
+
+    # Only boundaries where allowed-ness changes, in either paksha, matter.
+    # Just past boundary i the moon is in pada state i, and allowed-ness
+    # stays the same up to the next boundary that matters.
+    changes = np.flatnonzero((allowed != np.roll(allowed, 1, axis=0)).any(axis=1))
+    moon_minutes, moon_which = _crossings(_sid_moon, SIDEREAL_RATE, changes * batch.PADA_SPAN, m0, m1)
+    if (allowed[:, 0] != allowed[:, 1]).any():
+        # Elongation 0 starts Shukla (index 0), 180 Krishna (index 1)
+        paksha_minutes, paksha_which = _crossings(_elongation, SYNODIC_RATE, [0.0, 180.0], m0, m1)
+    else:
+        paksha_minutes = paksha_which = np.empty(0, dtype=np.int64)
+
+    # Replay the crossings in time order from the chart at the start
+    nak_num, pada, _, paksha = chart_state(_EPOCH + datetime.timedelta(minutes=int(m0)))
+    events = np.concatenate([[m0], moon_minutes, paksha_minutes])
+    pada_state = np.concatenate([[nak_num * 4 + pada - 1], changes[moon_which], np.full(len(paksha_minutes), -1)])
+    paksha_state = np.concatenate([[batch.PAKSHAS.index(paksha)], np.full(len(moon_minutes), -1), paksha_which])
+    order = np.argsort(events, kind="stable")
+    events = events[order]
+    ok = allowed[_fill_forward(pada_state[order]), _fill_forward(paksha_state[order])]
+    # Several crossings in one minute: the state after the last one holds
+    last = np.append(events[1:] != events[:-1], True)
+    events, ok = events[last], ok[last]
+
+    bounds = np.append(events, m1)
+    edges = np.flatnonzero(np.diff(np.concatenate([[False], ok, [False]]).astype(np.int8)))
+    utc, from_timestamp = datetime.timezone.utc, datetime.datetime.fromtimestamp
+    return [(from_timestamp(a * 60, utc), from_timestamp(b * 60, utc))
+            for a, b in zip(bounds[edges[::2]].tolist(), bounds[edges[1::2]].tolist())]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m vedic_bird.search", description="List the intervals in which a chart meets constraints.")
+    parser.add_argument("start", type=datetime.datetime.fromisoformat, help="UTC start, e.g. 2024-01-01 or 2024-01-01T06:30")
+    parser.add_argument("end", type=datetime.datetime.fromisoformat, help="UTC end (exclusive)")
+    parser.add_argument("--nakshatra", action="append")
+    parser.add_argument("--pada", type=int, action="append")
+    parser.add_argument("--rashi", action="append")
+    parser.add_argument("--paksha", action="append")
+    parser.add_argument("--bird", dest="ruling_bird", action="append")
+    parser.add_argument("--force", dest="siddha_force", action="append", help='e.g. "Peacock-Earth"')
+    args = parser.parse_args(argv)
+
+    try:
+        intervals = find_intervals(args.start, args.end, nakshatra=args.nakshatra, pada=args.pada, rashi=args.rashi,
+                                   paksha=args.paksha, ruling_bird=args.ruling_bird, siddha_force=args.siddha_force)
+    except ValueError as exc:
+        parser.error(str(exc))
+    for start, end in intervals:
+        print(f"{start:%Y-%m-%d %H:%M} - {end:%Y-%m-%d %H:%M} UTC  ({(end - start) / datetime.timedelta(hours=1):.1f} h)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
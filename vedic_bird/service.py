@@ -0,0 +1,232 @@
+"""JSON HTTP service for the chart pipeline.
+
+    python -m vedic_bird.service --port 8080
+
+    GET /chart?date=1990-05-17&time=08:30&tz=Asia/Kolkata
+    GET /chart?utc=1990-05-17T03:00
+    POST /chart   {"date": ..., "time": ..., "tz": ...}  or  {"utc": ...}
+    GET /metrics  Prometheus text format
+
+Charts only depend on the UTC minute, so results are kept in a bounded LRU
+cache keyed on it, and concurrent requests for a minute that is already
+being computed wait on that computation instead of starting another.
+Computation runs in a process pool so misses do not block the event loop.
+
+Uses only the standard library (asyncio streams, a minimal HTTP/1.1 parser
+with keep-alive); put it behind a real proxy for anything public.
+"""
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import datetime
+import json
+import os
+import time
+import urllib.parse
+
+from vedic_bird.chart import compute_chart, describe_chart, to_utc
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+MAX_BODY = 64 * 1024
+
+
+# Runs in the worker processes
+def chart_for_minute(minute):
+    utc_dt = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc) + datetime.timedelta(minutes=minute)
+    chart = compute_chart(utc_dt)
+    chart.update(describe_chart(chart))
+    chart["utc"] = utc_dt.strftime("%Y-%m-%dT%H:%MZ")
+    return chart
+
+
+# A string parameter; POST bodies can hold any JSON value
+def _param(params, name, default=None):
+    value = params[name] if default is None else params.get(name, default)
+    if not isinstance(value, str):
+        raise TypeError(f"{name} must be a string, not {type(value).__name__}")
+    return value
+
+
+# UTC minute since the Unix epoch for a request's parameters. Bad input
+# raises KeyError, ValueError or TypeError, and OverflowError for times
+# outside datetime's range once converted to UTC.
+def request_minute(params):
+    if not isinstance(params, dict):
+        raise TypeError(f"expected a JSON object, not {type(params).__name__}")
+    if "utc" in params:
+        utc_dt = datetime.datetime.fromisoformat(_param(params, "utc").replace("Z", "+00:00"))
+        if utc_dt.tzinfo is None:
+            utc_dt = utc_dt.replace(tzinfo=datetime.timezone.utc)
+        utc_dt = utc_dt.astimezone(datetime.timezone.utc)  # OverflowError here, not in the worker
+    else:
+        utc_dt = to_utc(datetime.date.fromisoformat(_param(params, "date")),
+                        datetime.time.fromisoformat(_param(params, "time")), _param(params, "tz", "UTC"))
+    return int(utc_dt.timestamp() // 60)
+
+
+class Metrics:
+    def __init__(self, window=10000):
+        self.counters = collections.Counter()
+        # Latencies of the most recent requests, for the quantiles
+        self.latencies = collections.deque(maxlen=window)
+
+    def observe(self, seconds):
+        self.latencies.append(seconds)
+
+    def quantile(self, q):
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def render(self):
+        c = self.counters
+        lookups = c["cache_hits"] + c["cache_misses"]
+        lines = [
+            f"chart_requests_total {c['requests']}",
+            f"chart_errors_total {c['errors']}",
+            f"chart_cache_hits_total {c['cache_hits']}",
+            f"chart_cache_misses_total {c['cache_misses']}",
+            f"chart_coalesced_total {c['coalesced']}",
+            f"chart_computed_total {c['computed']}",
+            f"chart_cache_hit_ratio {c['cache_hits'] / lookups if lookups else 0.0:.6f}",
+            f'chart_request_latency_seconds{{quantile="0.5"}} {self.quantile(0.5):.6f}',
+            f'chart_request_latency_seconds{{quantile="0.99"}} {self.quantile(0.99):.6f}',
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class ChartService:
+    def __init__(self, cache_size=100_000, executor=None, coalesce=True):
+        self.cache_size = cache_size
+        self.cache = collections.OrderedDict()
+        self.coalesce = coalesce
+        self.inflight = {}
+        self.executor = executor
+        self.metrics = Metrics()
+
+    # JSON payload for a minute; the encoded bytes are what gets cached
+    async def chart(self, minute):
+        counters = self.metrics.counters
+        if self.cache_size:
+            result = self.cache.get(minute)
+            if result is not None:
+                self.cache.move_to_end(minute)
+                counters["cache_hits"] += 1
+                return result
+            counters["cache_misses"] += 1
+
+        if self.coalesce and minute in self.inflight:
+            counters["coalesced"] += 1
+            return await asyncio.shield(self.inflight[minute])
+
+        task = asyncio.ensure_future(self._compute(minute))
+        if self.coalesce:
+            self.inflight[minute] = task
+            task.add_done_callback(lambda _: self.inflight.pop(minute, None))
+        return await asyncio.shield(task)
+
+    async def _compute(self, minute):
+        loop = asyncio.get_running_loop()
+        chart = await loop.run_in_executor(self.executor, chart_for_minute, minute)
+        result = json.dumps(chart, ensure_ascii=False).encode()
+        self.metrics.counters["computed"] += 1
+        if self.cache_size:
+            self.cache[minute] = result
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return result
+
+    async def handle(self, method, target, body):
+        url = urllib.parse.urlsplit(target)
+        if url.path == "/metrics":
+            return 200, "text/plain; version=0.0.4", self.metrics.render().encode()
+        if url.path != "/chart":
+            return 404, "application/json", b'{"error": "not found"}'
+
+        started = time.perf_counter()
+        self.metrics.counters["requests"] += 1
+        try:
+            if method == "GET":
+                params = dict(urllib.parse.parse_qsl(url.query))
+            elif method == "POST":
+                params = json.loads(body or b"{}")
+            else:
+                return 405, "application/json", b'{"error": "use GET or POST"}'
+            minute = request_minute(params)
+        except (KeyError, ValueError, TypeError, AttributeError, OverflowError) as exc:
+            self.metrics.counters["errors"] += 1
+            return 400, "application/json", json.dumps({"error": f"{type(exc).__name__}: {exc}"}).encode()
+
+        payload = await self.chart(minute)
+        self.metrics.observe(time.perf_counter() - started)
+        return 200, "application/json; charset=utf-8", payload
+
+    async def serve_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY:
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, content_type, payload = await self.handle(method, target, body)
+                except Exception as exc:
+                    status, content_type = 500, "application/json"
+                    payload = json.dumps({"error": f"{type(exc).__name__}: {exc}"}).encode()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8080):
+        return await asyncio.start_server(self.serve_connection, host, port)
+
+
+async def serve(host, port, cache_size, processes):
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+        service = ChartService(cache_size=cache_size, executor=executor, coalesce=cache_size > 0)
+        server = await service.start(host, port)
+        print(f"serving on http://{host}:{server.sockets[0].getsockname()[1]}")
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m vedic_bird.service", description="Serve charts over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--cache-size", type=int, default=100_000,
+                        help="LRU entries (UTC minutes) to keep; 0 disables caching and coalescing")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.cache_size, args.processes))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Small lookup tables for nakshatras, rashis, birds and Siddha forces.
+
+The name-based mappings below are the source of truth. CHART_TABLE codes
+what they give for each nakshatra and paksha as small ints, so a chart's
+bird, force, element and string type are one index away; check_consistency
+lists where the mappings disagree with each other.
+"""
+import array
+import sys
+
+# List of Nakshatras (consistent across both apps)
+nakshatras = ["Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra", "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purvaphalguni", "Uttaraphalguni", "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshta", "Mula", "Purvashada", "Uttarashada", "Shravana", "Dhanishta", "Shatabhisha", "Purvabhadra", "Uttarabhadra", "Revati"]
+
+# List of Rashis, in sidereal order from 0°
+rashis = ["Mesha", "Vrishabha", "Mithuna", "Karka", "Simha", "Kanya", "Tula", "Vrishchika", "Dhanu", "Makara", "Kumbha", "Meena"]
+
+# Original Pancha Pakshi bird mapping
+shukla_birds = {
+    "Vulture": ["Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira"],
+    "Owl": ["Ardra", "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purvaphalguni"],
+    "Crow": ["Uttaraphalguni", "Hasta", "Chitra", "Swati", "Vishakha"],
+    "Cock": ["Anuradha", "Jyeshta", "Mula", "Purvashada", "Uttarashada"],
+    "Peacock": ["Shravana", "Dhanishta", "Shatabhisha", "Purvabhadra", "Uttarabhadra", "Revati"]
+}
+krishna_birds = {
+    "Peacock": ["Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira"],
+    "Cock": ["Ardra", "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purvaphalguni"],
+    "Crow": ["Uttaraphalguni", "Hasta", "Chitra", "Swati", "Vishakha"],
+    "Owl": ["Anuradha", "Jyeshta", "Mula", "Purvashada", "Uttarashada"],
+    "Vulture": ["Shravana", "Dhanishta", "Shatabhisha", "Purvabhadra", "Uttarabhadra", "Revati"]
+}
+
+# Siddha Force mapping (from second app, fixed for Revati)
+def get_siddha_force(nak_name, paksha):
+    nak_index = nakshatras.index(nak_name)
+    if paksha == "Shukla":
+        if 0 <= nak_index <= 4:
+            return "Vulture-Ether 🦅🌌"
+        elif 5 <= nak_index <= 10:
+            return "Owl-Air 🦉💨"
+        elif 11 <= nak_index <= 15:
+            return "Crow-Fire 🐦‍⬛🔥"
+        elif 16 <= nak_index <= 20:
+            return "Cock-Water 🐓🌊"
+        else:  # 21-26
+            return "Peacock-Earth 🦚🌍"
+    else:  # Krishna
+        if 0 <= nak_index <= 4:
+            return "Peacock-Earth 🦚🌍"
+        elif 5 <= nak_index <= 10:
+            return "Cock-Water 🐓🌊"
+        elif 11 <= nak_index <= 15:
+            return "Crow-Fire 🐦‍⬛🔥"
+        elif 16 <= nak_index <= 20:
+            return "Owl-Air 🦉💨"
+        else:  # 21-26
+            return "Vulture-Ether 🦅🌌"
+
+# Original elements and mappings
+rashi_elements = {
+    "Mesha": "Fire", "Vrishabha": "Earth", "Mithuna": "Air", "Karka": "Water",
+    "Simha": "Fire", "Kanya": "Earth", "Tula": "Air", "Vrishchika": "Water",
+    "Dhanu": "Fire", "Makara": "Earth", "Kumbha": "Air", "Meena": "Water"
+}
+
+bird_to_sanskrit = {
+    "Vulture": "Gṛdhra",
+    "Owl": "Ulūka",
+    "Crow": "Kāka",
+    "Cock": "Kukkuṭa",
+    "Peacock": "Mayūra"
+}
+
+bird_to_element = {
+    "Vulture": "Fire",
+    "Owl": "Water",
+    "Crow": "Earth",
+    "Cock": "Air",
+    "Peacock": "Ether"
+}
+element_to_string = {
+    "Fire": "Type I",
+    "Water": "Type IIA",
+    "Air": "Type IIB",
+    "Earth": "Heterotic SO(32)",
+    "Ether": "Heterotic E8×E8"
+}
+
+PAKSHAS = ("Shukla", "Krishna")
+
+# Integer codes: a code is an index into one of these tuples
+BIRDS = tuple(shukla_birds)
+ELEMENTS = ("Fire", "Water", "Air", "Earth", "Ether")
+STRING_TYPES = tuple(element_to_string[element] for element in ELEMENTS)
+SIDDHA_FORCES = ("Vulture-Ether 🦅🌌", "Owl-Air 🦉💨", "Crow-Fire 🐦‍⬛🔥", "Cock-Water 🐓🌊", "Peacock-Earth 🦚🌍")
+BIRD_SANSKRIT = tuple(bird_to_sanskrit[bird] for bird in BIRDS)
+
+# Columns of CHART_TABLE
+BIRD, FORCE, ELEMENT, STRING_TYPE = range(4)
+CHART_COLUMNS = 4
+
+
+def _ruling_bird(nak_name, paksha):
+    birds = shukla_birds if paksha == "Shukla" else krishna_birds
+    return next((bird for bird, naks in birds.items() if nak_name in naks), None)
+
+
+# Row (nak_num * 2 + paksha index) * CHART_COLUMNS holds the codes of the
+# ruling bird (the first bird listing the nakshatra, as compute_chart has
+# always done), the Siddha force, the bird's element in bird_to_element and
+# that element's string type. -1 where a mapping has no entry.
+def _chart_table():
+    table = array.array("b")
+    for nak_name in nakshatras:
+        for paksha in PAKSHAS:
+            bird = _ruling_bird(nak_name, paksha)
+            element = bird_to_element.get(bird)
+            force = get_siddha_force(nak_name, paksha)
+            table.extend((
+                BIRDS.index(bird) if bird in BIRDS else -1,
+                SIDDHA_FORCES.index(force) if force in SIDDHA_FORCES else -1,
+                ELEMENTS.index(element) if element in ELEMENTS else -1,
+                STRING_TYPES.index(element_to_string[element]) if element in ELEMENTS else -1,
+            ))
+    return table
+
+
+CHART_TABLE = _chart_table()
+
+
+# (bird, force, element, string type) codes for a nakshatra index and paksha
+# index (into PAKSHAS)
+def chart_codes(nak_num, paksha):
+    row = (nak_num * 2 + paksha) * CHART_COLUMNS
+    return tuple(CHART_TABLE[row:row + CHART_COLUMNS])
+
+
+# Where the mappings disagree, as (level, message) pairs. "error" means a
+# chart would come out wrong or incomplete: a nakshatra with no ruling bird
+# or with several in one paksha, or a Siddha force naming another bird than
+# the ruling one (the Revati case, once). "note" is for the known split in
+# elements: the force names pair each bird with an element other than
+# bird_to_element's, which the chart's element and string type follow.
+def check_consistency():
+    problems = []
+    for paksha, birds in zip(PAKSHAS, (shukla_birds, krishna_birds)):
+        for nak_name in nakshatras:
+            owners = [bird for bird, naks in birds.items() if nak_name in naks]
+            if len(owners) != 1:
+                problems.append(("error", f"{nak_name} has {len(owners)} ruling birds in {paksha} paksha: {', '.join(owners) or 'none'}"))
+        for bird, naks in birds.items():
+            for nak_name in naks:
+                if nak_name not in nakshatras:
+                    problems.append(("error", f"{bird} lists unknown nakshatra {nak_name} in {paksha} paksha"))
+
+    force_elements = {}
+    for nak_name in nakshatras:
+        for paksha in PAKSHAS:
+            force = get_siddha_force(nak_name, paksha)
+            force_bird, _, force_element = force.split(" ")[0].partition("-")
+            bird = _ruling_bird(nak_name, paksha)
+            if force_bird != bird:
+                problems.append(("error", f"{nak_name} in {paksha} paksha: ruling bird {bird} but Siddha force {force}"))
+            if force not in SIDDHA_FORCES or bird_to_element.get(bird) not in ELEMENTS:
+                problems.append(("error", f"{nak_name} in {paksha} paksha has no code for {force} or for its bird's element"))
+            force_elements.setdefault(force_bird, set()).add(force_element)
+
+    for bird in BIRDS:
+        for force_element in sorted(force_elements.get(bird, ())):
+            if force_element != bird_to_element.get(bird):
+                problems.append(("note", f"{bird}: Siddha force element {force_element}, bird_to_element {bird_to_element.get(bird)} "
+                                         f"(chart element and string type use the latter)"))
+    return problems
+
+
+# Pancha Pakshi activities, strongest to weakest
+activities = ["Ruling", "Eating", "Walking", "Sleeping", "Dying"]
+
+# Order in which a bird moves through the activities, yama by yama and
+# within each yama's sub-periods, by paksha and day/night
+activity_sequences = {
+    "Shukla": {
+        "day": ["Eating", "Walking", "Ruling", "Sleeping", "Dying"],
+        "night": ["Eating", "Ruling", "Dying", "Walking", "Sleeping"],
+    },
+    "Krishna": {
+        "day": ["Eating", "Dying", "Sleeping", "Ruling", "Walking"],
+        "night": ["Eating", "Sleeping", "Walking", "Dying", "Ruling"],
+    },
+}
+
+# Share of a yama (out of its 144 nominal minutes) taken by each activity's
+# sub-period
+activity_minutes = {"Ruling": 48, "Eating": 30, "Walking": 36, "Sleeping": 18, "Dying": 12}
+
+
+# python -m vedic_bird.tables prints check_consistency's findings and fails
+# on errors
+def main():
+    found = check_consistency()
+    for level, message in found:
+        print(f"{level}: {message}")
+    return int(any(level == "error" for level, _ in found))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""Long-form description texts.
+
+Only imported when a chart is described (see chart.describe_chart), so
+computing charts does not pay for parsing these tables.
+"""
+
+# Siddha Force descriptions (from second app)
+descriptions = {
+    "Vulture-Ether 🦅🌌": "🌟 As the Vulture-Ether force governs your essence 🦅🌌, you embody profound intuition and spiritual detachment, soaring high above earthly concerns like a vulture circling the skies. 🦅✨ Your life path is marked by visionary insights and a deep connection to the cosmos, allowing you to perceive hidden truths that others miss. 🌌🔮 In challenges, you rise with resilience, transforming obstacles into opportunities for growth. 💪🌱 Your personality radiates a mysterious aura, drawing people to your wisdom, yet you maintain independence, avoiding superficial bonds. 🤝🚫 Relationships flourish when you embrace vulnerability, balancing your ethereal nature with grounded emotions. ❤️🌍 Career-wise, fields like spirituality, research, or aviation suit you, where your broad perspectives shine. ✈️📚 Health may involve occasional detachment from physical needs, so prioritize meditation and etheric practices like yoga to stay balanced. 🧘‍♂️🍃 Karmically, past lives of exploration grant you current-life gifts in foresight, but beware of isolation—engage with community for fulfillment. 👥🌟 Auspicious times align when your force is in Ruling state, empowering bold decisions. ⏰👑 Overall, embrace your soaring spirit to manifest dreams, turning the intangible into reality with grace and power. 🦅💫 This divination reveals a journey of enlightenment, where ether's vastness fuels your eternal quest for truth and freedom. 🌌🕊️ Lengthy paths await, filled with cosmic wonders and self-discovery. 🚀📖",
+    "Owl-Air 🦉💨": "🌟 Guided by the Owl-Air force 🦉💨, your core vibrates with intellectual wisdom and adaptable winds of change, much like an owl navigating the night with silent wings. 🦉🌬️ You possess sharp analytical skills and a thirst for knowledge, making you a natural learner and communicator in all realms. 📚🗣️ Life's winds may shift directions, but your flexibility turns them into advantages, fostering innovation and quick adaptations. 🔄💡 Personality-wise, you're witty and curious, enchanting others with your insights, though restlessness can lead to scattered energies—focus is key. 🎯🤔 In love, air's flow brings dynamic partnerships; nurture stability to avoid fleeting connections. ❤️🏠 Careers in writing, teaching, or technology harness your airy intellect for success. 💻🖋️ Health benefits from breathing exercises and fresh air, countering any nervous tendencies. 🌬️🧘 Karmic threads from past intellectual pursuits gift you eloquence, but learn patience to avoid superficiality. ⏳👥 Favorable periods emerge in Harmonizing states, ideal for collaborations and ideas. 🤝⏰ This Siddha force propels you toward enlightened adaptability, where air's freedom unlocks boundless potentials. 💨🕊️ Your divination unfolds as a whirlwind of discoveries, blending wisdom with whimsy for a fulfilling existence. 🌪️📖 Profound transformations await as you ride the currents of destiny with grace. 🚀✨",
+    "Crow-Fire 🐦‍⬛🔥": "🌟 The Crow-Fire force ignites your being 🐦‍⬛🔥, symbolizing vigilant transformation and communal energy, akin to a crow's clever spark amid flames. 🐦‍⬛🕯️ You exude passion and leadership, driving change with fiery determination and sharp observation. 🔥👀 Life's trials forge you stronger, turning adversity into triumphs through resourcefulness. ⚒️🏆 Your personality is energetic and social, thriving in groups where your charisma shines, but temper impulsiveness to build lasting alliances. 👥😊 Relationships burn brightly; channel fire's warmth for deep bonds, avoiding conflicts. ❤️🔥 Ideal careers include management, activism, or arts, where your fire fuels creativity. 🎨📈 Health requires cooling practices like hydration and calm activities to balance heat. 💧🧘 Karmically, past communal roles endow you with networking prowess, but resolve old rivalries. 🤝🕰️ Optimal times in Observing states enhance vigilance for opportunities. 👁️⏰ This force divines a path of passionate evolution, where fire's light illuminates success and connections. 🔥🌟 Your journey is a blazing trail of achievements, embroidered with transformative experiences and joyful camaraderie. 🚀📖 Embrace the flames to forge a legacy of inspiration and warmth. 🐦‍⬛💫",
+    "Cock-Water 🐓🌊": "🌟 Under the Cock-Water force's influence 🐓🌊, you reflect alertness and emotional renewal, like a rooster heralding dawn over flowing waters. 🐓💦 Your essence is protective and fluid, navigating life's currents with intuition and resilience. 🌊🛡️ You excel in empathy and healing, offering support that refreshes souls around you. 🤗💙 Challenges dissolve in your adaptable flow, emerging stronger through emotional depths. 🌊💪 Personality radiates charm and vigilance, fostering nurturing environments, though over-sensitivity needs boundaries. 🛡️😌 Love thrives in watery depths; seek partners who match your depth for harmonious unions. ❤️🌊 Careers in counseling, healthcare, or marine fields align with your watery vigilance. 🩺🚢 Health flourishes with water-based activities and emotional release practices. 🏊🧘 Karmic echoes from protective pasts grant intuitive gifts, but release fears for growth. 🕊️🕰️ Prime moments in Querying states aid insightful decisions and healings. ❓⏰ This divination promises a refreshing voyage, where water's flow carries you to emotional fulfillment and prosperity. 🌊🌟 Waves of opportunity and serenity define your path, enriched with profound connections and renewals. 🚀📖 Let the waters guide your vigilant spirit to shores of abundance. 🐓💫",
+    "Peacock-Earth 🦚🌍": "🌟 The Peacock-Earth force grounds your soul 🦚🌍, embodying beauty, stability, and manifestation, as a peacock displays splendor on solid ground. 🦚🌳 You manifest creativity and reliability, building lasting foundations with artistic flair. 🎨🛠️ Life's beauty unfolds through your efforts, turning visions into tangible realities. 🌍💎 Your personality is grounded yet vibrant, attracting admiration with poise, but avoid rigidity by embracing change. 😊🔄 Relationships bloom in stable soils; cultivate openness for colorful unions. ❤️🌿 Careers in design, agriculture, or business leverage your earthly grace for success. 🏗️🌱 Health stabilizes with nature walks and balanced diets, rooting your vitality. 🌳🍎 Karmic roots from creative lifetimes bestow manifestation powers, but humility tempers pride. 🌟🕰️ Auspicious phases in Remediating states foster healing and growth. 🛠️⏰ This force foretells a grounded odyssey, where earth's bounty yields beauty and security. 🌍🦚 Your divination is a tapestry of achievements, woven with elegance, stability, and joyous expressions. 🚀📖 Dance through life with peacock's allure, creating a world of enduring wonder. 💫🌟"
+}
+
+bird_descriptions = {
+    "Vulture": "In Pancha Pakshi Shastra, the Vulture (Gṛdhra) symbolizes Fire 🔥, representing transformation, power, and leadership. Mythically linked to Garuda, Vishnu's vehicle, it embodies swift action and protection. It engages in activities like Ruling (strongest) to Dying (weakest), influencing auspicious timings. Linked to Type I strings, it vibrates with dynamic, open-closed modes, enhancing fiery Rashis like Mesha with passionate drive! 🦅⚡",
+    "Owl": "The Owl (Ulūka) in Pancha Pakshi stands for Water 💧, signifying intuition, wisdom, and adaptability. Associated with Lakshmi's night vigilance, it's a harbinger of deep knowledge. Cycles through Eating, Walking, etc., for daily predictions. Tied to Type IIA strings, it flows in balanced, non-chiral dimensions, amplifying watery traits in Nakshatras like Pushya with emotional depth! 🦉🌊🔮",
+    "Crow": "Crow (Kāka) represents Earth 🌍, denoting practicality, intelligence, and ancestral connections. As Shani's messenger, it signifies resourcefulness and caution. Its states (Ruling to Sleeping) guide mundane tasks. Connected to Heterotic SO(32) strings, grounding hybrid symmetries, it stabilizes earthy Kanya Rashi with wise, analytical energy! 🐦🌿🧠",
+    "Cock": "The Cock (Kukkuṭa) embodies Air 🌬️, symbolizing alertness, courage, and communication. Linked to dawn and warriors like Kartikeya, it crows awakening and vigilance. Activities cycle for timing battles or starts. Aligned with Type IIB strings, chiral and self-dual, it boosts airy Mithuna with swift, intellectual winds! 🐔☁️🏹",
+    "Peacock": "Peacock (Mayūra) signifies Ether ✨, illustrating expansion, beauty, and spirituality. Vehicle of Kartikeya, it dances in royal harmony, representing boundless space. From Ruling (peak creativity) to Dying, it aids spiritual pursuits. Mapped to Heterotic E8×E8 strings, unifying grand symmetries, it elevates ethereal Meena with cosmic visions! 🦚🌌💫"
+}
+
+rashi_traits = {
+    "Mesha": "energetic pioneer 🔥🚀",
+    "Vrishabha": "patient builder 🌱🏰",
+    "Mithuna": "curious communicator 🗣️🌟",
+    "Karka": "nurturing protector 🏡❤️",
+    "Simha": "confident leader 👑🌞",
+    "Kanya": "analytical perfectionist 📊🔍",
+    "Tula": "diplomatic harmonizer ⚖️💕",
+    "Vrishchika": "intense transformer 🦂🔥",
+    "Dhanu": "adventurous philosopher 🏹📜",
+    "Makara": "disciplined achiever 🏔️🏆",
+    "Kumbha": "innovative visionary 💡🌐",
+    "Meena": "compassionate dreamer 🌊✨"
+}
+
+nak_traits = {
+    "Ashwini": "swift healer 🏇💨",
+    "Bharani": "creative warrior ⚔️🎨",
+    "Krittika": "fiery critic 🔥🗡️",
+    "Rohini": "artistic nurturer 🌸🍼",
+    "Mrigashira": "curious explorer 🦌🔎",
+    "Ardra": "stormy intellectual 🌩️🧠",
+    "Punarvasu": "renewing archer 🏹🔄",
+    "Pushya": "protective guru 🌟🛡️",
+    "Ashlesha": "intuitive serpent 🐍🔮",
+    "Magha": "regal ancestor 👑🕊️",
+    "Purvaphalguni": "loving performer ❤️🎭",
+    "Uttaraphalguni": "helpful analyst 🤝📈",
+    "Hasta": "skillful artisan 🖐️🛠️",
+    "Chitra": "charismatic architect 🌟🏗️",
+    "Swati": "independent diplomat ⚖️🌬️",
+    "Vishakha": "ambitious goal-setter 🏆🔥",
+    "Anuradha": "devoted friend 🤝❤️",
+    "Jyeshta": "protective elder 🛡️👴",
+    "Mula": "truth-seeking root 🌿🔍",
+    "Purvashada": "invincible optimist 🏹😊",
+    "Uttarashada": "enduring victor 🏆💪",
+    "Shravana": "learning listener 👂📚",
+    "Dhanishta": "musical networker 🎶🤝",
+    "Shatabhisha": "healing mystic 🌟🧙",
+    "Purvabhadra": "spiritual warrior ⚔️🙏",
+    "Uttarabhadra": "wise supporter 🧠🤝",
+    "Revati": "compassionate guide 🐟❤️"
+}
+
+fun_phrases = {
+    "Fire": ["ignite passions like a blazing star! 🔥🌟🦅", "transform challenges into victories with fiery zeal! ⚡🏆🔥", "soar high with unstoppable energy! 🚀🔥🕊️"],
+    "Water": ["flow through life with deep intuition! 💧🌊🦉", "adapt and nurture like ocean waves! 🌊❤️💙", "dive into emotions with graceful wisdom! 🏊‍♂️🔮💧"],
+    "Earth": ["build stable foundations with earthy wisdom! 🌍🏗️🐦", "grow steadily like ancient trees! 🌳💪🟫", "caw out practical solutions grounded in reality! 🐦🛠️🌿"],
+    "Air": ["dance freely with intellectual winds! 🌬️💃🐔", "crow ideas that soar through the skies! 🐔☁️🧠", "breeze through challenges with swift agility! 🌪️🏃‍♂️🌬️"],
+    "Ether": ["expand infinitely like cosmic space! ✨🌌🦚", "harmonize universes with ethereal grace! 🔮💫🌠", "peacock your boundless potential! 🦚🌈✨"]
+}
@@ -0,0 +1,17 @@
+"""Timezone helpers, cached once per process."""
+import functools
+import zoneinfo
+
+UTC = zoneinfo.ZoneInfo("UTC")
+
+
+# sorted(zoneinfo.available_timezones()) walks the whole tzdata tree, so
+# do it at most once per process
+@functools.cache
+def available_timezones():
+    return tuple(sorted(zoneinfo.available_timezones()))
+
+
+@functools.lru_cache(maxsize=None)
+def get_zone(name):
+    return zoneinfo.ZoneInfo(name)
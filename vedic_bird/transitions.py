@@ -0,0 +1,268 @@
+"""Precomputed nakshatra/pada/rashi and paksha transitions.
+
+The charts are computed at minute resolution, and the moon only changes
+pada about four times a day and paksha twice a month, so the state at every
+minute from 1899-12-31 to 2101-01-02 UTC (the app's 1900-2100 date range
+plus a day of timezone slack) is captured by two short sorted lists of
+"first minute of the new state". Lookups are a bisect into a memory-mapped
+file, with no trig at all.
+
+    python -m vedic_bird.transitions build     # writes DEFAULT_PATH
+    python -m vedic_bird.transitions verify    # checks it against compute_chart
+
+chart.chart_state reads the index when the file is there, for callers
+that only need the discrete state; compute_chart itself also returns the
+longitudes and boundary margins, which take the series anyway.
+
+File layout (little-endian): a 32-byte header (magic, version, first and
+end minute as minutes since the Unix epoch, pada count, paksha count), then
+int32 pada times, int32 paksha times, uint8 pada states and uint8 paksha states. Times
+are minutes since the base minute; a pada state is nak_num * 4 + pada - 1
+(so rashi_num is state // 9) and a paksha state is 0 for Shukla, 1 for
+Krishna.
+"""
+import argparse
+import bisect
+import datetime
+import functools
+import mmap
+import os
+import random
+import struct
+import sys
+import warnings
+
+MAGIC = b"VBTX"
+VERSION = 2
+HEADER = struct.Struct("<4sIqqII")
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "transitions.bin")
+
+START = datetime.datetime(1899, 12, 31, tzinfo=datetime.timezone.utc)
+END = datetime.datetime(2101, 1, 2, tzinfo=datetime.timezone.utc)
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+PAKSHAS = ("Shukla", "Krishna")
+
+
+# Naive datetimes are taken to be UTC, as in compute_chart
+def _minutes_since_epoch(utc_dt):
+    if utc_dt.tzinfo is None:
+        utc_dt = utc_dt.replace(tzinfo=datetime.timezone.utc)
+    return int(utc_dt.timestamp() // 60)
+
+
+# Raised for minutes the index does not cover; callers with another way to
+# get the chart state fall back on it
+class OutOfRange(LookupError):
+    pass
+
+
+class TransitionIndex:
+    def __init__(self, path=DEFAULT_PATH):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.base_minute, self.end_minute, n_pada, n_paksha = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {VERSION} transition index")
+
+        offset = HEADER.size
+        spans = {}
+        for name, count, itemsize in (("pada_times", n_pada, 4), ("paksha_times", n_paksha, 4),
+                                      ("pada_states", n_pada, 1), ("paksha_states", n_paksha, 1)):
+            spans[name] = (offset, offset + count * itemsize)
+            offset += count * itemsize
+
+        view = memoryview(self._mmap)
+        if sys.byteorder == "little":
+            self.pada_times = view[slice(*spans["pada_times"])].cast("i")
+            self.paksha_times = view[slice(*spans["paksha_times"])].cast("i")
+        else:
+            import array
+            self.pada_times = array.array("i", view[slice(*spans["pada_times"])])
+            self.pada_times.byteswap()
+            self.paksha_times = array.array("i", view[slice(*spans["paksha_times"])])
+            self.paksha_times.byteswap()
+        self.pada_states = view[slice(*spans["pada_states"])]
+        self.paksha_states = view[slice(*spans["paksha_states"])]
+        self._view = view
+        self.spans = spans
+
+    def close(self):
+        for name in ("pada_times", "paksha_times", "pada_states", "paksha_states", "_view"):
+            view = getattr(self, name)
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # (nak_num, pada, rashi_num, paksha) at a minute since the Unix epoch
+    def lookup_minute(self, minute):
+        if not self.base_minute <= minute < self.end_minute:
+            raise OutOfRange(f"minute {minute} is outside the indexed range {self.base_minute} to {self.end_minute}")
+        m = minute - self.base_minute
+        state = self.pada_states[bisect.bisect_right(self.pada_times, m) - 1]
+        paksha = self.paksha_states[bisect.bisect_right(self.paksha_times, m) - 1]
+        return state // 4, state % 4 + 1, state // 9, PAKSHAS[paksha]
+
+    # Same, for a UTC datetime truncated to the minute as compute_chart does
+    def lookup(self, utc_dt):
+        return self.lookup_minute(_minutes_since_epoch(utc_dt))
+
+    # Vectorized lookup for a datetime64 array; returns NumPy arrays
+    # (nak_num, pada, rashi_num, paksha index)
+    def lookup_many(self, times):
+        import numpy as np
+
+        m = times.astype("datetime64[m]").astype(np.int64) - self.base_minute
+        if len(m) and (m.min() < 0 or m.max() >= self.end_minute - self.base_minute):
+            raise OutOfRange("times fall outside the indexed range")
+        pada_times = np.frombuffer(self._mmap, np.dtype("<i4"), len(self.pada_times), self.spans["pada_times"][0])
+        paksha_times = np.frombuffer(self._mmap, np.dtype("<i4"), len(self.paksha_times), self.spans["paksha_times"][0])
+        pada_states = np.frombuffer(self._mmap, np.uint8, len(self.pada_states), self.spans["pada_states"][0])
+        paksha_states = np.frombuffer(self._mmap, np.uint8, len(self.paksha_states), self.spans["paksha_states"][0])
+
+        state = pada_states[np.searchsorted(pada_times, m, side="right") - 1]
+        paksha = paksha_states[np.searchsorted(paksha_times, m, side="right") - 1]
+        return state // 4, state % 4 + 1, state // 9, paksha
+
+
+@functools.cache
+def load(path=DEFAULT_PATH):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{path} not found; run 'python -m vedic_bird.transitions build' first")
+    return TransitionIndex(path)
+
+
+# The index for callers that can do without it: None if the file has not
+# been built, or if it is from another version (with a warning, once). The
+# outcome is kept for the process, so a missing file costs one stat.
+@functools.cache
+def load_if_built(path=DEFAULT_PATH):
+    try:
+        return load(path)
+    except FileNotFoundError:
+        return None
+    except ValueError as exc:
+        warnings.warn(f"{exc}; not using it (rebuild with 'python -m vedic_bird.transitions build')", RuntimeWarning, stacklevel=2)
+        return None
+
+
+# First minute of each new state. The state can change at most once per
+# hour (the moon needs over five hours to cross a pada), so evaluate on an
+# hourly grid and bisect each changed hour down to the minute.
+def _find_transitions(state_at, n_minutes):
+    import numpy as np
+
+    hours = np.arange(0, n_minutes + 60, 60)
+    hours[-1] = min(hours[-1], n_minutes - 1)
+    states = state_at(hours)
+    changed = np.flatnonzero(states[1:] != states[:-1])
+    lo, hi = hours[changed], hours[changed + 1]
+    old = states[changed]
+    while np.any(hi - lo > 1):
+        mid = (lo + hi) // 2
+        same = state_at(mid) == old
+        lo = np.where(same, mid, lo)
+        hi = np.where(same, hi, mid)
+    times = np.concatenate([[0], hi]).astype("<i4")
+    return times, np.concatenate([states[:1], states[changed + 1]]).astype(np.uint8)
+
+
+# Write the index for start to end (UTC datetimes, end exclusive)
+def build(path=DEFAULT_PATH, start=START, end=END):
+    import numpy as np
+    from vedic_bird import batch
+
+    base_minute = _minutes_since_epoch(start)
+    n_minutes = _minutes_since_epoch(end) - base_minute
+
+    # interpolate=False: evaluate the same series directly so the index
+    # agrees with compute_chart minute for minute
+    def chart(minutes):
+        times = (minutes + base_minute).astype("datetime64[m]")
+        return batch.compute(times, interpolate=False)
+
+    def pada_state(minutes):
+        res = chart(minutes)
+        return res["nak_num"].astype(np.int16) * 4 + res["pada"] - 1
+
+    def paksha_state(minutes):
+        return chart(minutes)["paksha"]
+
+    pada_times, pada_states = _find_transitions(pada_state, n_minutes)
+    paksha_times, paksha_states = _find_transitions(paksha_state, n_minutes)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, base_minute, base_minute + n_minutes, len(pada_times), len(paksha_times)))
+        for arr in (pada_times, paksha_times, pada_states, paksha_states):
+            f.write(arr.tobytes())
+    os.replace(tmp, path)
+    load.cache_clear()
+    load_if_built.cache_clear()
+    return len(pada_times), len(paksha_times)
+
+
+# Compare the index with compute_chart at random minutes, and at the minutes
+# on either side of randomly chosen transitions where errors would show up
+def verify(path=DEFAULT_PATH, samples=20000, seed=0):
+    from vedic_bird.chart import compute_chart
+    from vedic_bird.tables import nakshatras, rashis
+
+    rng = random.Random(seed)
+    index = TransitionIndex(path)
+    try:
+        minutes = [rng.randrange(index.base_minute, index.end_minute) for _ in range(samples)]
+        for times in (index.pada_times, index.paksha_times):
+            for _ in range(samples // 2):
+                t = index.base_minute + times[rng.randrange(1, len(times))]
+                minutes.extend((t - 1, t))
+
+        mismatches = []
+        for minute in minutes:
+            utc_dt = _EPOCH + datetime.timedelta(minutes=minute)
+            chart = compute_chart(utc_dt)
+            expected = (chart["nak_num"], chart["pada"], chart["rashi_num"], chart["paksha"])
+            got = index.lookup_minute(minute)
+            if got != expected:
+                mismatches.append((utc_dt, expected, got))
+    finally:
+        index.close()
+
+    for utc_dt, expected, got in mismatches[:20]:
+        print(f"{utc_dt:%Y-%m-%d %H:%M} expected {nakshatras[expected[0]]} pada {expected[1]} "
+              f"{rashis[expected[2]]} {expected[3]}, index has {nakshatras[got[0]]} pada {got[1]} "
+              f"{rashis[got[2]]} {got[3]}")
+    return len(minutes), len(mismatches)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m vedic_bird.transitions", description="Build or verify the transition index.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="precompute the index")
+    p_build.add_argument("--path", default=DEFAULT_PATH)
+    p_verify = sub.add_parser("verify", help="check the index against the direct calculation")
+    p_verify.add_argument("--path", default=DEFAULT_PATH)
+    p_verify.add_argument("--samples", type=int, default=20000)
+    p_verify.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        n_pada, n_paksha = build(args.path)
+        size = os.path.getsize(args.path)
+        print(f"wrote {args.path}: {n_pada} pada and {n_paksha} paksha transitions, {size} bytes")
+        return 0
+
+    checked, mismatches = verify(args.path, args.samples, args.seed)
+    print(f"checked {checked} minutes, {mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())